@@ -1,5 +1,8 @@
 """Configuration for Solana Narrative Radar"""
 
+import re
+from typing import Dict, List
+
 # Solana KOLs to track
 SOLANA_KOLS = [
     {"handle": "0xMert_", "name": "Mert Mumtaz", "org": "Helius"},
@@ -64,6 +67,83 @@ NARRATIVE_KEYWORDS = {
     ]
 }
 
+# Lowercased keyword tables, frozen once at import so matchers never re-lower needles
+NARRATIVE_KEYWORDS_LOWER = {
+    category: tuple(kw.lower() for kw in keywords)
+    for category, keywords in NARRATIVE_KEYWORDS.items()
+}
+
+# Typographic punctuation folded to the ASCII forms the keywords use
+# ("cross‑border", "Solana’s"). Keyword punctuation itself ("pump.fun") is kept.
+_NORMALIZE_TABLE = str.maketrans({
+    "\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"',
+    "\u2010": "-", "\u2011": "-", "\u2012": "-", "\u2013": "-", "\u2014": "-",
+    "\u00a0": " ",
+})
+
+
+def normalize(text: str) -> str:
+    """Normalize text for keyword matching; call once per document"""
+    if not text.isascii():  # translate is only needed for non-ASCII input
+        text = text.translate(_NORMALIZE_TABLE)
+    return text.lower()
+
+
+# Keyword matcher, compiled once at import. A single regex scan finds every
+# keyword occurrence instead of running one substring search per keyword.
+_KEYWORD_CATEGORIES: Dict[str, List[str]] = {}
+for _category, _keywords in NARRATIVE_KEYWORDS_LOWER.items():
+    for _keyword in _keywords:
+        _KEYWORD_CATEGORIES.setdefault(_keyword, []).append(_category)
+
+
+def _keyword_trie_pattern(keywords: List[str]) -> str:
+    """Build a regex alternation factored into a trie, so each position only tries
+    the branches that share its first character. Greedy optional tails make it
+    match the longest keyword at a position."""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-keyword marker
+    
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+    
+    return build(trie)
+
+
+# The zero-width lookahead lets matches overlap ("ai agent" and "agent")...
+_KEYWORD_PATTERN = re.compile(f"(?=({_keyword_trie_pattern(list(_KEYWORD_CATEGORIES))}))")
+# ...and the shorter keywords that prefix the longest match are credited too ("pump" in "pump.fun")
+_KEYWORD_PREFIXES = {
+    kw: [other for other in _KEYWORD_CATEGORIES if kw.startswith(other)]
+    for kw in _KEYWORD_CATEGORIES
+}
+
+
+def match_keywords(text: str, normalized: bool = False) -> Dict[str, List[str]]:
+    """Map each narrative category to the keywords it lists that occur in text.
+    Pass normalized=True when text already went through normalize()."""
+    found = set()
+    for match in _KEYWORD_PATTERN.finditer(text if normalized else normalize(text)):
+        found.update(_KEYWORD_PREFIXES[match.group(1)])
+    
+    matches: Dict[str, List[str]] = {}
+    for keyword in found:
+        for category in _KEYWORD_CATEGORIES[keyword]:
+            matches.setdefault(category, []).append(keyword)
+    # Keep categories in NARRATIVE_KEYWORDS order so classification is stable
+    return {category: matches[category] for category in NARRATIVE_KEYWORDS if category in matches}
+
+
 # Data sources
 DATA_SOURCES = {
     "github": "https://api.github.com",
@@ -9,23 +9,37 @@ Usage:
     python main.py              # Run full analysis
     python main.py --json       # Output JSON only
     python main.py --html       # Output HTML only
+    python main.py --no-cache   # Ignore cached on-chain metrics and GitHub searches
 """
 
 import sys
 import os
 import json
+import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Dict, Tuple
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from signal_fetcher import fetch_all_signals, Signal
-from narrative_detector import detect_narratives, NarrativeDetector
-from idea_generator import generate_all_ideas
-from report_generator import ReportGenerator
 from config import OUTPUT_DIR
 
+# Progress-line emoji per narrative category
+_CATEGORY_EMOJI: Dict[str, str] = {
+    "ai_agents": "🤖",
+    "infrastructure": "🏗️",
+    "stablecoins_payfi": "💵",
+    "rwa_tokenization": "🏦",
+    "mobile_consumer": "📱",
+    "depin": "🌐",
+    "memecoins": "🐸",
+}
+
+# Strength bars for scores 0-100, one block per 10 points
+_STRENGTH_BARS: Tuple[str, ...] = tuple("█" * i for i in range(11))
+
 
 def print_banner():
     """Print the ASCII banner"""
@@ -41,16 +55,29 @@ def print_banner():
     print(banner)
 
 
-def run_pipeline(output_format: str = "all") -> dict:
+def run_pipeline(
+    output_format: str = "all",
+    use_cache: bool = True,
+    output_dir: str = OUTPUT_DIR
+) -> dict:
     """
     Run the full narrative detection pipeline.
     
     Args:
         output_format: "all", "json", "html", or "markdown"
+        use_cache: Reuse recently cached on-chain metrics and GitHub searches instead of re-fetching
+        output_dir: Directory the reports are written to (created if missing)
     
     Returns:
         Dictionary with pipeline results and file paths
     """
+    # The pipeline modules pull in urllib/http.client and the report templates;
+    # import them here so `--help` and argument errors don't pay for them
+    from signal_fetcher import fetch_all_signals
+    from narrative_detector import detect_narratives
+    from idea_generator import generate_all_ideas
+    from report_generator import ReportGenerator
+    
     results = {
         "success": False,
         "timestamp": datetime.now().isoformat(),
@@ -65,7 +92,11 @@ def run_pipeline(output_format: str = "all") -> dict:
         print("   ├── Querying GitHub for trending Solana repos...")
         print("   └── Loading research-based signals...")
         
-        signals = fetch_all_signals()
+        # Setting up the report generator doesn't need the signals, so let it
+        # create the output directory while the fetchers wait on the network
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            generator_future = executor.submit(ReportGenerator, output_dir)
+            signals = fetch_all_signals(use_cache=use_cache)
         results["signals_collected"] = len(signals)
         print(f"   ✓ Collected {len(signals)} signals\n")
         
@@ -75,32 +106,27 @@ def run_pipeline(output_format: str = "all") -> dict:
         top_narratives = detector.get_top_narratives()
         results["narratives_detected"] = len(top_narratives)
         
+        # Collect the per-narrative lines and print them in one write
+        lines = []
         for narrative in top_narratives:
-            emoji = {
-                "ai_agents": "🤖",
-                "infrastructure": "🏗️",
-                "stablecoins_payfi": "💵",
-                "rwa_tokenization": "🏦",
-                "mobile_consumer": "📱",
-                "depin": "🌐",
-                "memecoins": "🐸",
-            }.get(narrative.category, "📊")
+            emoji = _CATEGORY_EMOJI.get(narrative.category, "📊")
             
-            strength_bar = "█" * int(narrative.strength_score / 10)
-            print(f"   {emoji} {narrative.name}: {strength_bar} ({narrative.strength_score:.0f}/100)")
+            strength_bar = _STRENGTH_BARS[min(10, int(narrative.strength_score // 10))]
+            lines.append(f"   {emoji} {narrative.name}: {strength_bar} ({narrative.strength_score:.0f}/100)")
+        if lines:
+            print("\n".join(lines))
         
         print(f"\n   ✓ Detected {len(top_narratives)} active narratives\n")
         
         # Step 3: Generate build ideas
         print("💡 Phase 3: Generating Build Ideas...")
         all_ideas = generate_all_ideas(top_narratives)
-        total_ideas = sum(len(ideas) for ideas in all_ideas.values())
+        total_ideas = sum(map(len, all_ideas.values()))
         print(f"   ✓ Generated {total_ideas} build ideas\n")
         
         # Step 4: Generate reports
         print("📝 Phase 4: Generating Reports...")
-        os.makedirs(OUTPUT_DIR, exist_ok=True)
-        generator = ReportGenerator(OUTPUT_DIR)
+        generator = generator_future.result()
         
         paths = generator.save_reports(top_narratives)
         results["files_generated"] = list(paths.values())
@@ -168,18 +194,27 @@ def main():
         default=OUTPUT_DIR,
         help=f"Output directory (default: {OUTPUT_DIR})"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached on-chain metrics and GitHub searches and fetch fresh data"
+    )
     
     args = parser.parse_args()
     
+    # Fetcher progress goes through logging; keep it on stdout with the rest of
+    # the output, and show only warnings when running quietly
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="    %(message)s",
+        stream=sys.stdout
+    )
+    
     if not args.quiet:
         print_banner()
     
-    # Update output directory if specified
-    if args.output != OUTPUT_DIR:
-        from config import OUTPUT_DIR as cfg_dir
-        os.makedirs(args.output, exist_ok=True)
-    
-    results = run_pipeline(args.format)
+    # ReportGenerator creates the output directory, so it isn't made here too
+    results = run_pipeline(args.format, use_cache=not args.no_cache, output_dir=args.output)
     
     if not args.quiet:
         print("\n✨ Done! Check the output directory for reports.")
@@ -1,12 +1,31 @@
 """Narrative Detector - Advanced clustering and scoring of signals into emerging narratives"""
 
+import functools
+import heapq
 import re
+import sys
 from typing import List, Dict, Any, Tuple
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta
+from itertools import islice
 
 from signal_fetcher import Signal
-from config import NARRATIVE_KEYWORDS
+from config import match_keywords
+
+# Figures pulled out of signal descriptions as evidence, compiled once
+_AMOUNT_RE = re.compile(r'\$[\d.,]+[BMK]?\+?')
+_PCT_RE = re.compile(r'[\d.,]+%')
+_SCALE_RE = re.compile(r'[\d.,]+[KM]\+?\s+(?:users|transactions|tokens|daily|active)', re.I)
+
+# Quality points for a signal's on-chain signal_strength
+_STRENGTH_POINTS = {"high": 3, "medium": 1}
+
+
+@functools.lru_cache(maxsize=1024)
+def _topic_categories(topic: str) -> Tuple[str, ...]:
+    """Categories whose keywords occur in a normalized GitHub topic.
+    Repos share a small vocabulary of topics, so most lookups hit the cache."""
+    return tuple(match_keywords(topic, normalized=True))
 
 
 class Narrative:
@@ -19,7 +38,7 @@ class Narrative:
         self.strength_score = 0.0
         self.momentum = "stable"  # rising, stable, declining
         self.confidence = 0.0  # 0-100 confidence in narrative
-        self.evidence: List[str] = []
+        self.evidence: Tuple[str, ...] = ()
         self.why_emerging: str = ""  # Explanation of WHY this narrative is emerging
         self.build_ideas: List[Dict[str, str]] = []
         self.summary = ""
@@ -35,6 +54,23 @@ class Narrative:
             self.confidence = 0.0
             return
         
+        # Gather every per-signal input to the scores in a single pass
+        sources = set()
+        total_stars = 0
+        evidence_count = 0
+        strength_points = 0
+        recent_signals = 0
+        cutoff = datetime.now() - timedelta(days=7)
+        for s in self.signals:
+            metadata = s.metadata
+            sources.add(s.source)
+            if s.source == "github":
+                total_stars += metadata.get("stars", 0)
+            evidence_count += len(metadata.get("evidence", ()))
+            strength_points += _STRENGTH_POINTS.get(metadata.get("signal_strength"), 0)
+            if s.naive_timestamp > cutoff:
+                recent_signals += 1
+        
         # === SIGNAL VOLUME SCORE (0-25 points) ===
         # More signals = stronger narrative
         signal_count = len(self.signals)
@@ -42,15 +78,11 @@ class Narrative:
         
         # === SOURCE DIVERSITY SCORE (0-25 points) ===
         # Signals from multiple sources = more confidence
-        source_counts = defaultdict(int)
-        for s in self.signals:
-            source_counts[s.source] += 1
-        
-        source_diversity = len(source_counts)
+        source_diversity = len(sources)
         diversity_score = min(source_diversity * 8, 25)
         
         # Bonus for having on-chain data (Helius)
-        has_onchain = "helius_onchain" in source_counts
+        has_onchain = "helius_onchain" in sources
         if has_onchain:
             diversity_score = min(diversity_score + 10, 25)
         
@@ -59,41 +91,18 @@ class Narrative:
         quality_score = 0
         
         # GitHub stars indicate project quality
-        total_stars = sum(
-            s.metadata.get("stars", 0) 
-            for s in self.signals 
-            if s.source == "github"
-        )
         quality_score += min(total_stars / 500, 10)
         
         # Evidence items from research
-        evidence_count = sum(
-            len(s.metadata.get("evidence", []))
-            for s in self.signals
-        )
         quality_score += min(evidence_count * 1.5, 10)
         
         # On-chain metrics boost quality significantly
-        for s in self.signals:
-            if s.metadata.get("signal_strength") == "high":
-                quality_score += 3
-            elif s.metadata.get("signal_strength") == "medium":
-                quality_score += 1
+        quality_score += strength_points
         
         quality_score = min(quality_score, 25)
         
         # === RECENCY SCORE (0-15 points) ===
         # More recent signals = more relevant
-        now = datetime.now()
-        recent_signals = 0
-        for s in self.signals:
-            try:
-                # Handle timezone-aware vs naive datetimes
-                ts = s.timestamp.replace(tzinfo=None) if s.timestamp.tzinfo else s.timestamp
-                if (now - ts).days < 7:
-                    recent_signals += 1
-            except:
-                recent_signals += 1  # Assume recent if can't parse
         recency_score = min(recent_signals * 2, 15)
         
         # === CATEGORY-SPECIFIC BOOSTS (0-10 points) ===
@@ -189,6 +198,9 @@ class NarrativeDetector:
         }
     }
     
+    # Known categories, for membership checks on the classification path
+    CATEGORIES = frozenset(NARRATIVE_INFO)
+    
     def __init__(self):
         self.narratives: Dict[str, Narrative] = {}
         self._initialize_narratives()
@@ -200,56 +212,58 @@ class NarrativeDetector:
             narrative.why_emerging = info["base_why"]
             self.narratives[category] = narrative
     
-    def _match_keywords(self, text: str, keywords: List[str]) -> Tuple[bool, int, List[str]]:
-        """Check if text matches keywords, return match count and matched keywords"""
-        text_lower = text.lower()
-        matched_keywords = [kw for kw in keywords if kw.lower() in text_lower]
-        return len(matched_keywords) > 0, len(matched_keywords), matched_keywords
-    
     def classify_signal(self, signal: Signal) -> List[str]:
         """Classify a signal into one or more narrative categories"""
         categories = []
-        text = f"{signal.title} {signal.description}".lower()
         
         # Check metadata category if available (from research or Helius)
-        if "category" in signal.metadata and signal.metadata["category"]:
-            preset_cat = signal.metadata["category"]
-            if preset_cat in self.narratives:
+        preset_cat = signal.metadata.get("category")
+        if preset_cat and isinstance(preset_cat, str):
+            # Categories decoded from cached JSON aren't interned like the
+            # literals in NARRATIVE_INFO; interning lets lookups match by identity
+            preset_cat = sys.intern(preset_cat)
+            if preset_cat in self.CATEGORIES:
                 categories.append(preset_cat)
         
-        # Enhanced keyword matching
-        for category, keywords in NARRATIVE_KEYWORDS.items():
-            matched, count, matched_kws = self._match_keywords(text, keywords)
-            if matched and count >= 1:
-                if category not in categories:
-                    categories.append(category)
-                # Score based on match density
-                signal.relevance_score = max(signal.relevance_score, min(count * 0.15, 1.0))
+        # Enhanced keyword matching: one scan finds keywords for every category
+        matches = match_keywords(signal.match_text, normalized=True)
+        for category in matches:
+            if category not in categories:
+                categories.append(category)
+        # Score based on match density of the best-matching category
+        if matches and signal.relevance_score < 1.0:
+            densest = max(map(len, matches.values()))
+            signal.relevance_score = max(signal.relevance_score, min(densest * 0.15, 1.0))
         
         # Check GitHub topics for additional signal
         if signal.source == "github":
-            topics = signal.metadata.get("topics", [])
-            for topic in topics:
-                topic_text = topic.lower()
-                for category, keywords in NARRATIVE_KEYWORDS.items():
-                    if any(kw in topic_text for kw in keywords):
-                        if category not in categories:
-                            categories.append(category)
+            for topic in signal.match_topics:
+                for category in _topic_categories(topic):
+                    if category not in categories:
+                        categories.append(category)
         
         return categories
     
     def process_signals(self, signals: List[Signal]):
         """Process all signals and assign them to narratives"""
+        buckets = defaultdict(list)
         for signal in signals:
             categories = self.classify_signal(signal)
             signal.narrative_tags = categories
             
             for category in categories:
-                if category in self.narratives:
-                    self.narratives[category].add_signal(signal)
+                buckets[category].append(signal)
+        
+        # Hand each narrative its signals in one go
+        for category, category_signals in buckets.items():
+            if category in self.CATEGORIES:
+                self.narratives[category].signals.extend(category_signals)
         
-        # Calculate strengths and extract insights
+        # Calculate strengths and extract insights; narratives without signals
+        # keep their zeroed defaults
         for narrative in self.narratives.values():
+            if not narrative.signals:
+                continue
             narrative.calculate_strength()
             self._extract_evidence(narrative)
             self._extract_metrics(narrative)
@@ -261,30 +275,25 @@ class NarrativeDetector:
         
         for signal in narrative.signals:
             # Add evidence from metadata
-            if "evidence" in signal.metadata:
-                for e in signal.metadata["evidence"]:
-                    evidence.add(e)
+            evidence.update(signal.metadata.get("evidence", ()))
             
             # Extract key metrics from description
             desc = signal.description
             
             # Dollar amounts (market signals)
-            amounts = re.findall(r'\$[\d.,]+[BMK]?\+?', desc)
-            for amt in amounts:
-                evidence.add(f"Market signal: {amt}")
+            evidence.update(f"Market signal: {amt}" for amt in _AMOUNT_RE.findall(desc))
             
             # Percentages (growth metrics)
-            pcts = re.findall(r'[\d.,]+%', desc)
-            for pct in pcts:
-                if float(pct.replace('%', '').replace(',', '')) > 20:
-                    evidence.add(f"Growth: {pct}")
+            evidence.update(
+                f"Growth: {pct}" for pct in _PCT_RE.findall(desc)
+                if float(pct.replace('%', '').replace(',', '')) > 20
+            )
             
             # Large numbers (user/transaction counts)
-            large_nums = re.findall(r'[\d.,]+[KM]\+?\s+(?:users|transactions|tokens|daily|active)', desc, re.I)
-            for num in large_nums:
-                evidence.add(f"Scale: {num}")
+            evidence.update(f"Scale: {num}" for num in _SCALE_RE.findall(desc))
         
-        narrative.evidence = list(evidence)[:12]  # Top 12 evidence points
+        # Immutable so build ideas can share slices of it without copying
+        narrative.evidence = tuple(islice(evidence, 12))  # Top 12 evidence points
     
     def _extract_metrics(self, narrative: Narrative):
         """Extract on-chain metrics from Helius signals"""
@@ -314,11 +323,11 @@ class NarrativeDetector:
         
         # If we have signal-specific explanations, enhance the base explanation
         if signal_whys:
-            unique_whys = list(set(signal_whys))[:3]  # Top 3 unique explanations
-            combined = f"{narrative.why_emerging}\n\n**Key Drivers:**\n"
-            for why in unique_whys:
-                combined += f"• {why}\n"
-            narrative.why_emerging = combined.strip()
+            # Top 3 unique explanations, in signal order so reports are reproducible
+            unique_whys = list(dict.fromkeys(signal_whys))[:3]
+            parts = [f"{narrative.why_emerging}\n\n**Key Drivers:**"]
+            parts.extend(f"• {why}" for why in unique_whys)
+            narrative.why_emerging = "\n".join(parts).strip()
         
         # Add on-chain evidence if available
         if narrative.key_metrics:
@@ -336,13 +345,13 @@ class NarrativeDetector:
     
     def get_top_narratives(self, limit: int = 7) -> List[Narrative]:
         """Get top narratives sorted by strength, filtering out weak ones"""
-        sorted_narratives = sorted(
-            self.narratives.values(),
-            key=lambda n: (n.strength_score, len(n.signals), n.confidence),
-            reverse=True
-        )
         # Only return narratives with signals AND minimum strength
-        return [n for n in sorted_narratives if n.signals and n.strength_score >= 20][:limit]
+        candidates = (n for n in self.narratives.values() if n.signals and n.strength_score >= 20)
+        return heapq.nlargest(
+            limit,
+            candidates,
+            key=lambda n: (n.strength_score, len(n.signals), n.confidence)
+        )
     
     def get_narrative_summary(self) -> Dict[str, Any]:
         """Get comprehensive summary of all narratives"""
@@ -366,8 +375,11 @@ def detect_narratives(signals: List[Signal]) -> NarrativeDetector:
 
 
 if __name__ == "__main__":
+    import logging
     from signal_fetcher import fetch_all_signals
     
+    logging.basicConfig(level=logging.INFO, format="    %(message)s")
+    
     signals = fetch_all_signals()
     detector = detect_narratives(signals)
     
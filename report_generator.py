@@ -3,128 +3,89 @@
 import os
 import json
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from string import Formatter
+from typing import List, Dict, Any, Callable, Iterator, NamedTuple, Tuple
 
 from narrative_detector import Narrative
 
 
-class ReportGenerator:
-    """Generates beautiful, data-rich reports in HTML and Markdown formats"""
+_CATEGORY_EMOJI: Dict[str, str] = {
+    "ai_agents": "🤖",
+    "infrastructure": "🏗️",
+    "stablecoins_payfi": "💵",
+    "rwa_tokenization": "🏦",
+    "mobile_consumer": "📱",
+    "depin": "🌐",
+    "memecoins": "🐸",
+    "defi_evolution": "💱",
+    "zk_compression": "🔐"
+}
+_SOURCE_ICONS: Dict[str, str] = {"github": "🐙", "helius_onchain": "⛓️", "research": "📰"}
+_MOMENTUM_ICONS: Dict[str, str] = {"rising": "📈", "stable": "➡️", "declining": "📉"}
+
+# Markdown strength bars for scores 0-100, one filled block per 10 points
+_STRENGTH_BARS: Tuple[str, ...] = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+
+@lru_cache(maxsize=256)
+def _join_tech_stack(tech_stack: Tuple[str, ...]) -> str:
+    """Comma-join an idea's tech stack; the stacks are static template tuples"""
+    return ", ".join(tech_stack)
+
+
+@lru_cache(maxsize=8)
+def _format_generated(timestamp: datetime) -> str:
+    """Report timestamp as 'YYYY-MM-DD HH:MM UTC'; every report of a save shares one"""
+    return timestamp.strftime('%Y-%m-%d %H:%M UTC')
+
+
+def _write_text(path: str, text: str) -> None:
+    """Write a whole report with one write() through a buffer large enough to hold it"""
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(text)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write an already-encoded report; no text layer, so nothing is re-encoded"""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+class _ReportAggregates(NamedTuple):
+    """Report-wide figures gathered in one pass over the narratives"""
+    total_signals: int
+    signal_counts: List[int]
+    onchain_stats: Dict[str, str]
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Parse a str.format-style template once, returning a fast renderer.
     
-    def __init__(self, output_dir: str = "output"):
-        self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+    str.format re-parses its template on every call, which dominates for the
+    large, mostly static dashboard shell. Pre-splitting it into literal
+    chunks, field names and format specs leaves only a join per render.
+    """
+    literals = []
+    fields = []
+    for literal, field, spec, _ in Formatter().parse(template):
+        literals.append(literal)
+        fields.append((field, spec) if field is not None else None)
     
-    def generate_markdown(self, narratives: List[Narrative], timestamp: datetime = None) -> str:
-        """Generate a comprehensive markdown report"""
-        timestamp = timestamp or datetime.now()
-        
-        md = []
-        md.append("# 🔮 Solana Narrative Radar Report")
-        md.append(f"\n**Generated:** {timestamp.strftime('%Y-%m-%d %H:%M UTC')}")
-        md.append(f"\n**Analysis Period:** Past 14 days")
-        md.append(f"\n**Total Signals Analyzed:** {sum(len(n.signals) for n in narratives)}")
-        md.append(f"\n**Data Sources:** GitHub API, Helius On-Chain Data, Ecosystem Research")
-        md.append("\n---\n")
-        
-        # Executive Summary
-        md.append("## 📊 Executive Summary\n")
-        md.append("The following narratives are emerging in the Solana ecosystem, ranked by signal strength, source diversity, and on-chain validation:\n")
-        
-        for i, narrative in enumerate(narratives, 1):
-            strength_bar = "█" * int(narrative.strength_score / 10) + "░" * (10 - int(narrative.strength_score / 10))
-            momentum_icon = "📈" if narrative.momentum == "rising" else "➡️" if narrative.momentum == "stable" else "📉"
-            md.append(f"{i}. **{narrative.name}** [{strength_bar}] {narrative.strength_score:.0f}/100 {momentum_icon}")
-            md.append(f"   - Confidence: {narrative.confidence:.0f}% | Signals: {len(narrative.signals)}")
-        
-        md.append("\n---\n")
-        
-        # Detailed Narratives
-        for narrative in narratives:
-            md.append(f"## {self._get_emoji(narrative.category)} {narrative.name}")
-            md.append(f"\n**Strength Score:** {narrative.strength_score:.0f}/100 | **Confidence:** {narrative.confidence:.0f}% | **Momentum:** {narrative.momentum.title()} | **Signals:** {len(narrative.signals)}\n")
-            
-            # Why This Narrative is Emerging
-            md.append("### 🎯 Why This Narrative is Emerging")
-            md.append(f"\n{narrative.why_emerging}\n")
-            
-            # Evidence
-            if narrative.evidence:
-                md.append("\n### 🔍 Key Evidence")
-                for ev in narrative.evidence[:6]:
-                    md.append(f"- {ev}")
-            
-            # On-Chain Metrics
-            if narrative.key_metrics:
-                md.append("\n### 📡 On-Chain Metrics (via Helius)")
-                for key, value in narrative.key_metrics.items():
-                    if isinstance(value, (int, float)) and value > 0:
-                        formatted = f"{value:,.0f}" if isinstance(value, int) else f"{value:,.2f}"
-                        md.append(f"- **{key.replace('_', ' ').title()}:** {formatted}")
-            
-            # Build Ideas
-            if narrative.build_ideas:
-                md.append("\n### 💡 Build Ideas")
-                for idea in narrative.build_ideas[:3]:
-                    md.append(f"\n#### {idea['name']}")
-                    md.append(f"\n{idea['description']}")
-                    md.append(f"\n- **Tech Stack:** {', '.join(idea['tech_stack'])}")
-                    md.append(f"- **Difficulty:** {idea['difficulty'].title()}")
-                    md.append(f"- **Time to Build:** {idea['time_to_build']}")
-                    md.append(f"- **Revenue Model:** {idea['potential_revenue']}")
-                    md.append(f"- **Why Now:** {idea['why_now']}")
-            
-            # Top Signals
-            md.append("\n### 📡 Top Signals")
-            for signal in narrative.signals[:5]:
-                source_icon = {"github": "🐙", "helius_onchain": "⛓️", "research": "📰"}.get(signal.source, "📊")
-                md.append(f"- {source_icon} [{signal.title}]({signal.url})")
-            
-            md.append("\n---\n")
-        
-        # Action Plan
-        md.append("## 🚀 Recommended Action Plan\n")
-        md.append("Based on narrative strength, confidence levels, and on-chain validation:\n")
-        
-        if narratives:
-            top = narratives[0]
-            md.append(f"1. **Highest Priority:** {top.name}")
-            md.append(f"   - Strength {top.strength_score:.0f}/100 with {top.confidence:.0f}% confidence")
-            if top.build_ideas:
-                md.append(f"   - Start with: **{top.build_ideas[0]['name']}**")
-        
-        if len(narratives) > 1:
-            second = narratives[1]
-            md.append(f"\n2. **Secondary Focus:** {second.name}")
-            md.append(f"   - {second.momentum.title()} momentum, good market timing")
-        
-        if len(narratives) > 2:
-            third = narratives[2]
-            md.append(f"\n3. **Emerging Opportunity:** {third.name}")
-        
-        md.append("\n---\n")
-        md.append("*Report generated by Solana Narrative Radar v2.0*")
-        md.append(f"\n*Data sources: GitHub API (authenticated), Helius On-Chain API, Curated Research*")
-        
-        return "\n".join(md)
+    def render(**values: Any) -> str:
+        parts = []
+        for literal, field in zip(literals, fields):
+            parts.append(literal)
+            if field is not None:
+                parts.append(format(values[field[0]], field[1]))
+        return "".join(parts)
     
-    def generate_html(self, narratives: List[Narrative], timestamp: datetime = None) -> str:
-        """Generate a stunning HTML dashboard report"""
-        timestamp = timestamp or datetime.now()
-        total_signals = sum(len(n.signals) for n in narratives)
-        
-        # Get on-chain data summary for header
-        onchain_stats = self._get_onchain_summary(narratives)
-        
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Solana Narrative Radar | Live Dashboard</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
-    <style>
-        :root {{
+    return render
+
+
+# Static head of the HTML dashboard: no per-report values, so it is plain
+# text, built once and emitted as-is.
+_STATIC_CSS = """        :root {
             --sol-purple: #9945FF;
             --sol-green: #14F195;
             --sol-blue: #00D1FF;
@@ -136,30 +97,30 @@ class ReportGenerator:
             --text-primary: #ffffff;
             --text-secondary: #8888a0;
             --border-color: #2a2a3a;
-        }}
+        }
         
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
             background: var(--bg-dark);
             color: var(--text-primary);
             line-height: 1.6;
             min-height: 100vh;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
         /* Hero Header */
-        .hero {{
+        .hero {
             background: linear-gradient(135deg, rgba(153, 69, 255, 0.15) 0%, rgba(0, 209, 255, 0.15) 50%, rgba(20, 241, 149, 0.1) 100%);
             border: 1px solid var(--border-color);
             border-radius: 24px;
@@ -167,9 +128,9 @@ class ReportGenerator:
             margin-bottom: 30px;
             position: relative;
             overflow: hidden;
-        }}
+        }
         
-        .hero::before {{
+        .hero::before {
             content: '';
             position: absolute;
             top: -50%;
@@ -178,19 +139,19 @@ class ReportGenerator:
             height: 200%;
             background: radial-gradient(circle at 30% 30%, rgba(153, 69, 255, 0.1) 0%, transparent 50%);
             animation: pulse 8s ease-in-out infinite;
-        }}
+        }
         
-        @keyframes pulse {{
-            0%, 100% {{ transform: scale(1); opacity: 0.5; }}
-            50% {{ transform: scale(1.1); opacity: 0.8; }}
-        }}
+        @keyframes pulse {
+            0%, 100% { transform: scale(1); opacity: 0.5; }
+            50% { transform: scale(1.1); opacity: 0.8; }
+        }
         
-        .hero-content {{
+        .hero-content {
             position: relative;
             z-index: 1;
-        }}
+        }
         
-        .hero h1 {{
+        .hero h1 {
             font-size: 2.8rem;
             font-weight: 800;
             background: linear-gradient(135deg, var(--sol-green) 0%, var(--sol-blue) 50%, var(--sol-purple) 100%);
@@ -198,43 +159,43 @@ class ReportGenerator:
             -webkit-text-fill-color: transparent;
             background-clip: text;
             margin-bottom: 12px;
-        }}
+        }
         
-        .hero .tagline {{
+        .hero .tagline {
             font-size: 1.1rem;
             color: var(--text-secondary);
             margin-bottom: 24px;
-        }}
+        }
         
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
             gap: 16px;
             margin-top: 20px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: rgba(255,255,255,0.05);
             border: 1px solid var(--border-color);
             border-radius: 12px;
             padding: 16px 20px;
             text-align: center;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 1.8rem;
             font-weight: 700;
             color: var(--sol-green);
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 0.85rem;
             color: var(--text-secondary);
             margin-top: 4px;
-        }}
+        }
         
         /* Live Badge */
-        .live-badge {{
+        .live-badge {
             display: inline-flex;
             align-items: center;
             gap: 6px;
@@ -246,38 +207,38 @@ class ReportGenerator:
             font-size: 0.8rem;
             font-weight: 600;
             margin-bottom: 16px;
-        }}
+        }
         
-        .live-dot {{
+        .live-dot {
             width: 8px;
             height: 8px;
             background: var(--sol-green);
             border-radius: 50%;
             animation: blink 1.5s infinite;
-        }}
+        }
         
-        @keyframes blink {{
-            0%, 100% {{ opacity: 1; }}
-            50% {{ opacity: 0.3; }}
-        }}
+        @keyframes blink {
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.3; }
+        }
         
         /* Narrative Cards */
-        .section-title {{
+        .section-title {
             font-size: 1.4rem;
             font-weight: 700;
             margin: 30px 0 20px;
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
         
-        .narratives-grid {{
+        .narratives-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(380px, 1fr));
             gap: 24px;
-        }}
+        }
         
-        .narrative-card {{
+        .narrative-card {
             background: var(--bg-card);
             border: 1px solid var(--border-color);
             border-radius: 16px;
@@ -285,9 +246,9 @@ class ReportGenerator:
             transition: all 0.3s ease;
             position: relative;
             overflow: hidden;
-        }}
+        }
         
-        .narrative-card::before {{
+        .narrative-card::before {
             content: '';
             position: absolute;
             top: 0;
@@ -297,67 +258,67 @@ class ReportGenerator:
             background: linear-gradient(90deg, var(--sol-purple), var(--sol-green));
             opacity: 0;
             transition: opacity 0.3s;
-        }}
+        }
         
-        .narrative-card:hover {{
+        .narrative-card:hover {
             transform: translateY(-4px);
             border-color: var(--sol-purple);
             box-shadow: 0 20px 40px rgba(153, 69, 255, 0.15);
-        }}
+        }
         
-        .narrative-card:hover::before {{
+        .narrative-card:hover::before {
             opacity: 1;
-        }}
+        }
         
-        .narrative-header {{
+        .narrative-header {
             display: flex;
             justify-content: space-between;
             align-items: flex-start;
             margin-bottom: 16px;
-        }}
+        }
         
-        .narrative-emoji {{
+        .narrative-emoji {
             font-size: 2rem;
             margin-bottom: 8px;
-        }}
+        }
         
-        .narrative-title {{
+        .narrative-title {
             font-size: 1.15rem;
             font-weight: 700;
             color: var(--text-primary);
             line-height: 1.3;
-        }}
+        }
         
-        .score-badge {{
+        .score-badge {
             background: linear-gradient(135deg, var(--sol-purple), var(--sol-blue));
             padding: 8px 14px;
             border-radius: 10px;
             font-weight: 700;
             font-size: 1.1rem;
             white-space: nowrap;
-        }}
+        }
         
-        .metrics-row {{
+        .metrics-row {
             display: flex;
             gap: 16px;
             margin: 16px 0;
             flex-wrap: wrap;
-        }}
+        }
         
-        .metric {{
+        .metric {
             display: flex;
             align-items: center;
             gap: 6px;
             font-size: 0.85rem;
             color: var(--text-secondary);
-        }}
+        }
         
-        .metric-value {{
+        .metric-value {
             color: var(--sol-green);
             font-weight: 600;
-        }}
+        }
         
-        .momentum-badge {{
+        .momentum-badge {
             display: inline-flex;
             align-items: center;
             gap: 4px;
@@ -365,87 +326,87 @@ class ReportGenerator:
             border-radius: 6px;
             font-size: 0.75rem;
             font-weight: 600;
-        }}
+        }
         
-        .momentum-rising {{
+        .momentum-rising {
             background: rgba(20, 241, 149, 0.15);
             color: var(--sol-green);
-        }}
+        }
         
-        .momentum-stable {{
+        .momentum-stable {
             background: rgba(0, 209, 255, 0.15);
             color: var(--sol-blue);
-        }}
+        }
         
-        .momentum-declining {{
+        .momentum-declining {
             background: rgba(255, 107, 107, 0.15);
             color: var(--sol-pink);
-        }}
+        }
         
         /* Strength Bar */
-        .strength-bar-container {{
+        .strength-bar-container {
             margin: 16px 0;
-        }}
+        }
         
-        .strength-bar {{
+        .strength-bar {
             height: 8px;
             background: rgba(255,255,255,0.1);
             border-radius: 4px;
             overflow: hidden;
-        }}
+        }
         
-        .strength-fill {{
+        .strength-fill {
             height: 100%;
             background: linear-gradient(90deg, var(--sol-green), var(--sol-blue), var(--sol-purple));
             border-radius: 4px;
             transition: width 1s ease-out;
-        }}
+        }
         
-        .strength-labels {{
+        .strength-labels {
             display: flex;
             justify-content: space-between;
             font-size: 0.75rem;
             color: var(--text-secondary);
             margin-top: 6px;
-        }}
+        }
         
         /* Why Section */
-        .why-section {{
+        .why-section {
             background: rgba(153, 69, 255, 0.08);
             border-left: 3px solid var(--sol-purple);
             padding: 14px;
             border-radius: 0 8px 8px 0;
             margin: 16px 0;
-        }}
+        }
         
-        .why-title {{
+        .why-title {
             font-size: 0.8rem;
             font-weight: 600;
             color: var(--sol-purple);
             margin-bottom: 8px;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .why-text {{
+        .why-text {
             font-size: 0.9rem;
             color: var(--text-secondary);
             line-height: 1.6;
             white-space: pre-line;
-        }}
+        }
         
-        .why-text-content {{
+        .why-text-content {
             display: block;
-        }}
+        }
         
-        .why-text-content.collapsed {{
+        .why-text-content.collapsed {
             display: -webkit-box;
             -webkit-line-clamp: 4;
             -webkit-box-orient: vertical;
             overflow: hidden;
-        }}
+        }
         
-        .why-toggle {{
+        .why-toggle {
             background: none;
             border: none;
             color: var(--sol-purple);
@@ -457,39 +418,39 @@ class ReportGenerator:
             align-items: center;
             gap: 4px;
             transition: color 0.2s;
-        }}
+        }
         
-        .why-toggle:hover {{
+        .why-toggle:hover {
             color: var(--sol-green);
-        }}
+        }
         
-        .why-toggle-icon {{
+        .why-toggle-icon {
             transition: transform 0.3s ease;
-        }}
+        }
         
-        .why-toggle.expanded .why-toggle-icon {{
+        .why-toggle.expanded .why-toggle-icon {
             transform: rotate(180deg);
-        }}
+        }
         
         /* Evidence Pills */
-        .evidence-section {{
+        .evidence-section {
             margin: 16px 0;
-        }}
+        }
         
-        .evidence-title {{
+        .evidence-title {
             font-size: 0.8rem;
             font-weight: 600;
             color: var(--text-secondary);
             margin-bottom: 10px;
-        }}
+        }
         
-        .evidence-pills {{
+        .evidence-pills {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
-        }}
+        }
         
-        .evidence-pill {{
+        .evidence-pill {
             background: rgba(20, 241, 149, 0.1);
             border: 1px solid rgba(20, 241, 149, 0.3);
             color: var(--sol-green);
@@ -497,16 +458,16 @@ class ReportGenerator:
             border-radius: 20px;
             font-size: 0.8rem;
             font-weight: 500;
-        }}
+        }
         
         /* Build Ideas */
-        .ideas-section {{
+        .ideas-section {
             margin-top: 20px;
             padding-top: 20px;
             border-top: 1px solid var(--border-color);
-        }}
+        }
         
-        .ideas-title {{
+        .ideas-title {
             font-size: 0.9rem;
             font-weight: 600;
             color: var(--sol-blue);
@@ -514,55 +475,55 @@ class ReportGenerator:
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
+        }
         
-        .idea-card {{
+        .idea-card {
             background: rgba(0, 209, 255, 0.05);
             border: 1px solid rgba(0, 209, 255, 0.2);
             border-radius: 10px;
             padding: 14px;
             margin: 10px 0;
-        }}
+        }
         
-        .idea-name {{
+        .idea-name {
             font-weight: 600;
             color: var(--text-primary);
             margin-bottom: 6px;
-        }}
+        }
         
-        .idea-desc {{
+        .idea-desc {
             font-size: 0.85rem;
             color: var(--text-secondary);
             margin-bottom: 10px;
-        }}
+        }
         
-        .idea-meta {{
+        .idea-meta {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
-        }}
+        }
         
-        .idea-tag {{
+        .idea-tag {
             background: rgba(153, 69, 255, 0.15);
             color: var(--sol-purple);
             padding: 4px 10px;
             border-radius: 4px;
             font-size: 0.75rem;
             font-weight: 500;
-        }}
+        }
         
         /* Signals */
-        .signals-section {{
+        .signals-section {
             margin-top: 16px;
-        }}
+        }
         
-        .signals-title {{
+        .signals-title {
             font-size: 0.8rem;
             color: var(--text-secondary);
             margin-bottom: 10px;
-        }}
+        }
         
-        .signal {{
+        .signal {
             display: flex;
             align-items: center;
             gap: 8px;
@@ -572,39 +533,39 @@ class ReportGenerator:
             color: var(--text-secondary);
             font-size: 0.85rem;
             transition: color 0.2s;
-        }}
+        }
         
-        .signal:last-child {{
+        .signal:last-child {
             border-bottom: none;
-        }}
+        }
         
-        .signal:hover {{
+        .signal:hover {
             color: var(--sol-green);
-        }}
+        }
         
-        .signal-icon {{
+        .signal-icon {
             font-size: 1rem;
             flex-shrink: 0;
-        }}
+        }
         
         /* Action Plan */
-        .action-plan {{
+        .action-plan {
             background: linear-gradient(135deg, rgba(20, 241, 149, 0.1), rgba(0, 209, 255, 0.1));
             border: 1px solid var(--border-color);
             border-radius: 16px;
             padding: 30px;
             margin: 40px 0;
-        }}
+        }
         
-        .action-plan h2 {{
+        .action-plan h2 {
             font-size: 1.4rem;
             margin-bottom: 20px;
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
         
-        .action-item {{
+        .action-item {
             background: var(--bg-card);
             border: 1px solid var(--border-color);
             border-radius: 10px;
@@ -613,9 +574,9 @@ class ReportGenerator:
             display: flex;
             gap: 16px;
             align-items: flex-start;
-        }}
+        }
         
-        .action-number {{
+        .action-number {
             background: linear-gradient(135deg, var(--sol-purple), var(--sol-green));
             width: 32px;
             height: 32px;
@@ -625,54 +586,68 @@ class ReportGenerator:
             justify-content: center;
             font-weight: 700;
             flex-shrink: 0;
-        }}
+        }
         
-        .action-content {{
+        .action-content {
             flex: 1;
-        }}
+        }
         
-        .action-title {{
+        .action-title {
             font-weight: 600;
             margin-bottom: 4px;
-        }}
+        }
         
-        .action-desc {{
+        .action-desc {
             font-size: 0.9rem;
             color: var(--text-secondary);
-        }}
+        }
         
         /* Footer */
-        footer {{
+        footer {
             text-align: center;
             padding: 40px 20px;
             color: var(--text-secondary);
             font-size: 0.85rem;
             border-top: 1px solid var(--border-color);
             margin-top: 40px;
-        }}
+        }
         
-        footer a {{
+        footer a {
             color: var(--sol-purple);
             text-decoration: none;
-        }}
+        }
         
         /* Responsive */
-        @media (max-width: 768px) {{
-            .hero h1 {{
+        @media (max-width: 768px) {
+            .hero h1 {
                 font-size: 2rem;
-            }}
+            }
             
-            .narratives-grid {{
+            .narratives-grid {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .stats-grid {{
+            .stats-grid {
                 grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Solana Narrative Radar | Live Dashboard</title>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
+    <style>
+""" + _STATIC_CSS + """    </style>
 </head>
-<body>
+"""
+_HTML_HEAD_BYTES = _HTML_HEAD.encode("utf-8")
+
+# Dynamic parts of the page shell, compiled once at import.
+_HTML_PAGE_HEADER = _compile_template("""<body>
     <div class="container">
         <!-- Hero Section -->
         <header class="hero">
@@ -686,7 +661,7 @@ class ReportGenerator:
                 
                 <div class="stats-grid">
                     <div class="stat-card">
-                        <div class="stat-value">{len(narratives)}</div>
+                        <div class="stat-value">{narrative_count}</div>
                         <div class="stat-label">Active Narratives</div>
                     </div>
                     <div class="stat-card">
@@ -694,15 +669,15 @@ class ReportGenerator:
                         <div class="stat-label">Signals Analyzed</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-value">{onchain_stats.get('tps', 'N/A')}</div>
+                        <div class="stat-value">{tps}</div>
                         <div class="stat-label">Network TPS</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-value">{onchain_stats.get('stablecoins', 'N/A')}</div>
+                        <div class="stat-value">{stablecoins}</div>
                         <div class="stat-label">Stablecoin TVL</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-value">{timestamp.strftime('%H:%M')}</div>
+                        <div class="stat-value">{updated}</div>
                         <div class="stat-label">Last Updated (UTC)</div>
                     </div>
                 </div>
@@ -712,105 +687,343 @@ class ReportGenerator:
         <!-- Narratives Section -->
         <h2 class="section-title">📊 Emerging Narratives</h2>
         <div class="narratives-grid">
-"""
+""")
+
+_HTML_PAGE_FOOTER = _compile_template("""
+        </div>
         
-        # Generate narrative cards
-        for narrative in narratives:
-            emoji = self._get_emoji(narrative.category)
-            momentum_class = f"momentum-{narrative.momentum}"
-            momentum_icon = "📈" if narrative.momentum == "rising" else "➡️" if narrative.momentum == "stable" else "📉"
-            
-            html += f"""
+        <footer>
+            <p>Generated by <strong>Solana Narrative Radar v2.0</strong></p>
+            <p>Data sources: <a href="https://helius.xyz" target="_blank">Helius API</a> (on-chain), GitHub API, Ecosystem Research</p>
+            <p>Report generated: {generated}</p>
+        </footer>
+    </div>
+    
+""")
+
+# Page script, kept readable here and minified once at import. Each line is
+# a complete statement or brace, so joining the stripped lines is safe.
+_TOGGLE_SCRIPT_SOURCE = """
+function toggleWhy(btn) {
+    const content = btn.previousElementSibling;
+    const isCollapsed = content.classList.contains('collapsed');
+    
+    if (isCollapsed) {
+        content.classList.remove('collapsed');
+        btn.classList.add('expanded');
+        btn.querySelector('span:first-child').textContent = 'Show less';
+    } else {
+        content.classList.add('collapsed');
+        btn.classList.remove('expanded');
+        btn.querySelector('span:first-child').textContent = 'Read more';
+    }
+}
+"""
+_HTML_PAGE_TAIL = (
+    "    <script>"
+    + "".join(line.strip() for line in _TOGGLE_SCRIPT_SOURCE.splitlines())
+    + "</script>\n</body>\n</html>\n"
+)
+
+# Per-narrative fragments of the dashboard, rendered once per card
+_NARRATIVE_CARD_TMPL = _compile_template("""
             <div class="narrative-card">
                 <div class="narrative-header">
                     <div>
                         <div class="narrative-emoji">{emoji}</div>
-                        <div class="narrative-title">{narrative.name}</div>
+                        <div class="narrative-title">{name}</div>
                     </div>
-                    <div class="score-badge">{narrative.strength_score:.0f}</div>
+                    <div class="score-badge">{strength:.0f}</div>
                 </div>
                 
                 <div class="metrics-row">
                     <div class="metric">
                         <span>Confidence:</span>
-                        <span class="metric-value">{narrative.confidence:.0f}%</span>
+                        <span class="metric-value">{confidence:.0f}%</span>
                     </div>
                     <div class="metric">
                         <span>Signals:</span>
-                        <span class="metric-value">{len(narrative.signals)}</span>
+                        <span class="metric-value">{signal_count}</span>
                     </div>
-                    <span class="momentum-badge {momentum_class}">{momentum_icon} {narrative.momentum.title()}</span>
+                    <span class="momentum-badge momentum-{momentum}">{momentum_icon} {momentum_label}</span>
                 </div>
                 
                 <div class="strength-bar-container">
                     <div class="strength-bar">
-                        <div class="strength-fill" style="width: {narrative.strength_score}%"></div>
+                        <div class="strength-fill" style="width: {strength}%"></div>
                     </div>
                     <div class="strength-labels">
                         <span>Signal Strength</span>
-                        <span>{narrative.strength_score:.0f}/100</span>
+                        <span>{strength:.0f}/100</span>
                     </div>
                 </div>
                 
                 <div class="why-section">
                     <div class="why-title">🎯 Why This Narrative is Emerging</div>
                     <div class="why-text">
-                        <span class="why-text-content{' collapsed' if len(narrative.why_emerging) > 200 else ''}">{narrative.why_emerging}</span>
-                        {f'<button class="why-toggle" onclick="toggleWhy(this)"><span>Read more</span><span class="why-toggle-icon">▼</span></button>' if len(narrative.why_emerging) > 200 else ''}
+                        <span class="why-text-content{collapsed}">{why}</span>
+                        {toggle}
                     </div>
                 </div>
-"""
-            
-            # Evidence pills
-            if narrative.evidence:
-                html += """
-                <div class="evidence-section">
-                    <div class="evidence-title">Key Evidence:</div>
-                    <div class="evidence-pills">
-"""
-                for ev in narrative.evidence[:4]:
-                    html += f'                        <span class="evidence-pill">{ev[:40]}{"..." if len(ev) > 40 else ""}</span>\n'
-                html += """                    </div>
-                </div>
-"""
-            
-            # Build ideas
-            if narrative.build_ideas:
-                html += """
-                <div class="ideas-section">
-                    <div class="ideas-title">💡 Top Build Ideas</div>
-"""
-                for idea in narrative.build_ideas[:2]:
-                    html += f"""
+""")
+
+# Why-text collapse class and toggle button, indexed by "is the text long"
+_WHY_COLLAPSED = ("", " collapsed")
+_WHY_TOGGLE = ("", '<button class="why-toggle" onclick="toggleWhy(this)"><span>Read more</span><span class="why-toggle-icon">▼</span></button>')
+
+_IDEA_CARD_TMPL = _compile_template("""
                     <div class="idea-card">
-                        <div class="idea-name">{idea['name']}</div>
-                        <div class="idea-desc">{idea['description'][:120]}...</div>
+                        <div class="idea-name">{name}</div>
+                        <div class="idea-desc">{description}...</div>
                         <div class="idea-meta">
-                            <span class="idea-tag">{idea['difficulty'].title()}</span>
-                            <span class="idea-tag">{idea['time_to_build']}</span>
-                            <span class="idea-tag">{idea['potential_revenue'][:30]}</span>
+                            <span class="idea-tag">{difficulty}</span>
+                            <span class="idea-tag">{time_to_build}</span>
+                            <span class="idea-tag">{revenue}</span>
                         </div>
                     </div>
+""")
+
+_ACTION_ITEM_TMPL = _compile_template("""
+            <div class="action-item">
+                <div class="action-number">{number}</div>
+                <div class="action-content">
+                    <div class="action-title">{title}</div>
+                    <div class="action-desc">{desc}</div>
+                </div>
+            </div>
+""")
+
+# Browser-side card renderer for generate_html_lite. It rebuilds the same
+# markup as _iter_card_html / the action plan from window.__NARRATIVES.
+_HTML_LITE_RENDERER = """
+        <script>
+            (function () {
+                const esc = s => String(s).replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'})[c]);
+                const cut = (s, n, more) => s.length > n ? s.slice(0, n) + (more || '') : s;
+                const title = s => s.charAt(0).toUpperCase() + s.slice(1);
+                const data = window.__NARRATIVES;
+                
+                document.querySelector('.narratives-grid').innerHTML = data.narratives.map(n => {
+                    const long = n.why.length > 200;
+                    let html = `
+            <div class="narrative-card">
+                <div class="narrative-header">
+                    <div>
+                        <div class="narrative-emoji">${n.emoji}</div>
+                        <div class="narrative-title">${esc(n.name)}</div>
+                    </div>
+                    <div class="score-badge">${n.score}</div>
+                </div>
+                <div class="metrics-row">
+                    <div class="metric"><span>Confidence:</span> <span class="metric-value">${n.confidence}%</span></div>
+                    <div class="metric"><span>Signals:</span> <span class="metric-value">${n.signal_count}</span></div>
+                    <span class="momentum-badge momentum-${n.momentum}">${n.momentum_icon} ${title(n.momentum)}</span>
+                </div>
+                <div class="strength-bar-container">
+                    <div class="strength-bar"><div class="strength-fill" style="width: ${n.strength}%"></div></div>
+                    <div class="strength-labels"><span>Signal Strength</span><span>${n.score}/100</span></div>
+                </div>
+                <div class="why-section">
+                    <div class="why-title">🎯 Why This Narrative is Emerging</div>
+                    <div class="why-text">
+                        <span class="why-text-content${long ? ' collapsed' : ''}">${esc(n.why)}</span>
+                        ${long ? '<button class="why-toggle" onclick="toggleWhy(this)"><span>Read more</span><span class="why-toggle-icon">▼</span></button>' : ''}
+                    </div>
+                </div>`;
+                    if (n.evidence.length) {
+                        html += '<div class="evidence-section"><div class="evidence-title">Key Evidence:</div><div class="evidence-pills">'
+                            + n.evidence.map(ev => `<span class="evidence-pill">${esc(cut(ev, 40, '...'))}</span>`).join('')
+                            + '</div></div>';
+                    }
+                    if (n.ideas.length) {
+                        html += '<div class="ideas-section"><div class="ideas-title">💡 Top Build Ideas</div>'
+                            + n.ideas.map(i => `
+                    <div class="idea-card">
+                        <div class="idea-name">${esc(i.name)}</div>
+                        <div class="idea-desc">${esc(cut(i.description, 120))}...</div>
+                        <div class="idea-meta">
+                            <span class="idea-tag">${esc(title(i.difficulty))}</span>
+                            <span class="idea-tag">${esc(i.time_to_build)}</span>
+                            <span class="idea-tag">${esc(cut(i.potential_revenue, 30))}</span>
+                        </div>
+                    </div>`).join('')
+                            + '</div>';
+                    }
+                    html += '<div class="signals-section"><div class="signals-title">📡 Recent Signals:</div>'
+                        + n.signals.map(s => `<a href="${esc(s.url)}" class="signal" target="_blank"><span class="signal-icon">${s.icon}</span> ${esc(cut(s.title, 45, '...'))}</a>`).join('')
+                        + '</div>';
+                    return html + '</div>';
+                }).join('');
+                
+                document.querySelector('.action-plan').insertAdjacentHTML('beforeend', data.actions.map((a, i) => `
+            <div class="action-item">
+                <div class="action-number">${i + 1}</div>
+                <div class="action-content">
+                    <div class="action-title">${esc(a.title)}</div>
+                    <div class="action-desc">${esc(a.desc)}</div>
+                </div>
+            </div>`).join(''));
+            })();
+        </script>
 """
-                html += """                </div>
-"""
+
+
+class ReportGenerator:
+    """Generates beautiful, data-rich reports in HTML and Markdown formats"""
+    
+    def __init__(self, output_dir: str = "output"):
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        # (narrative ids, aggregates) shared by the reports of one save_reports call
+        self._totals_memo = None
+    
+    def generate_markdown(self, narratives: List[Narrative], timestamp: datetime = None) -> str:
+        """Generate a comprehensive markdown report"""
+        timestamp = timestamp or datetime.now()
+        totals = self._aggregate(narratives)
+        
+        # Each append is a whole block of lines rendered by one f-string; the
+        # blocks are joined with newlines at the end
+        md = [
+            "# 🔮 Solana Narrative Radar Report\n"
+            f"\n**Generated:** {_format_generated(timestamp)}\n"
+            "\n**Analysis Period:** Past 14 days\n"
+            f"\n**Total Signals Analyzed:** {totals.total_signals}\n"
+            "\n**Data Sources:** GitHub API, Helius On-Chain Data, Ecosystem Research\n"
+            "\n---\n\n"
+            # Executive Summary
+            "## 📊 Executive Summary\n\n"
+            "The following narratives are emerging in the Solana ecosystem, ranked by signal strength, source diversity, and on-chain validation:\n"
+        ]
+        # Bound once; the loops below append a few hundred blocks per report
+        add = md.append
+        
+        for i, (narrative, sig_count) in enumerate(zip(narratives, totals.signal_counts), 1):
+            strength_bar = _STRENGTH_BARS[min(10, int(narrative.strength_score // 10))]
+            momentum_icon = _MOMENTUM_ICONS.get(narrative.momentum, "📉")
+            add(
+                f"{i}. **{narrative.name}** [{strength_bar}] {narrative.strength_score:.0f}/100 {momentum_icon}\n"
+                f"   - Confidence: {narrative.confidence:.0f}% | Signals: {sig_count}"
+            )
+        
+        add("\n---\n")
+        
+        # Detailed Narratives
+        for narrative, sig_count in zip(narratives, totals.signal_counts):
+            add(
+                f"## {self._get_emoji(narrative.category)} {narrative.name}\n"
+                f"\n**Strength Score:** {narrative.strength_score:.0f}/100 | **Confidence:** {narrative.confidence:.0f}% | **Momentum:** {narrative.momentum.title()} | **Signals:** {sig_count}\n\n"
+                # Why This Narrative is Emerging
+                "### 🎯 Why This Narrative is Emerging\n"
+                f"\n{narrative.why_emerging}\n"
+            )
             
-            # Top signals
-            html += """
-                <div class="signals-section">
-                    <div class="signals-title">📡 Recent Signals:</div>
-"""
-            for signal in narrative.signals[:3]:
-                icon = {"github": "🐙", "helius_onchain": "⛓️", "research": "📰"}.get(signal.source, "📊")
-                title = signal.title[:45] + "..." if len(signal.title) > 45 else signal.title
-                html += f'                    <a href="{signal.url}" class="signal" target="_blank"><span class="signal-icon">{icon}</span> {title}</a>\n'
+            # Evidence
+            if narrative.evidence:
+                add("\n### 🔍 Key Evidence")
+                md.extend(f"- {ev}" for ev in narrative.evidence[:6])
             
-            html += """                </div>
-            </div>
-"""
+            # On-Chain Metrics
+            if narrative.key_metrics:
+                add("\n### 📡 On-Chain Metrics (via Helius)")
+                for key, value in narrative.key_metrics.items():
+                    if isinstance(value, (int, float)) and value > 0:
+                        formatted = f"{value:,.0f}" if isinstance(value, int) else f"{value:,.2f}"
+                        add(f"- **{key.replace('_', ' ').title()}:** {formatted}")
+            
+            # Build Ideas
+            if narrative.build_ideas:
+                add("\n### 💡 Build Ideas")
+                for idea in narrative.build_ideas[:3]:
+                    add(
+                        f"\n#### {idea['name']}\n"
+                        f"\n{idea['description']}\n"
+                        f"\n- **Tech Stack:** {_join_tech_stack(tuple(idea['tech_stack']))}\n"
+                        f"- **Difficulty:** {idea['difficulty'].title()}\n"
+                        f"- **Time to Build:** {idea['time_to_build']}\n"
+                        f"- **Revenue Model:** {idea['potential_revenue']}\n"
+                        f"- **Why Now:** {idea['why_now']}"
+                    )
+            
+            # Top Signals
+            add("\n### 📡 Top Signals")
+            for signal in narrative.signals[:5]:
+                source_icon = _SOURCE_ICONS.get(signal.source, "📊")
+                add(f"- {source_icon} [{signal.title}]({signal.url})")
+            
+            add("\n---\n")
         
         # Action Plan
-        html += """
+        add(
+            "## 🚀 Recommended Action Plan\n\n"
+            "Based on narrative strength, confidence levels, and on-chain validation:\n"
+        )
+        
+        if narratives:
+            top = narratives[0]
+            add(
+                f"1. **Highest Priority:** {top.name}\n"
+                f"   - Strength {top.strength_score:.0f}/100 with {top.confidence:.0f}% confidence"
+            )
+            if top.build_ideas:
+                add(f"   - Start with: **{top.build_ideas[0]['name']}**")
+        
+        if len(narratives) > 1:
+            second = narratives[1]
+            add(
+                f"\n2. **Secondary Focus:** {second.name}\n"
+                f"   - {second.momentum.title()} momentum, good market timing"
+            )
+        
+        if len(narratives) > 2:
+            third = narratives[2]
+            add(f"\n3. **Emerging Opportunity:** {third.name}")
+        
+        add(
+            "\n---\n\n"
+            "*Report generated by Solana Narrative Radar v2.0*\n"
+            "\n*Data sources: GitHub API (authenticated), Helius On-Chain API, Curated Research*"
+        )
+        
+        return "\n".join(md)
+    
+    def generate_html(self, narratives: List[Narrative], timestamp: datetime = None) -> str:
+        """Generate a stunning HTML dashboard report"""
+        return _HTML_HEAD + "".join(self._iter_html_body(narratives, timestamp or datetime.now()))
+    
+    def generate_html_bytes(self, narratives: List[Narrative], timestamp: datetime = None) -> bytes:
+        """Generate the HTML dashboard as UTF-8, reusing the pre-encoded static head"""
+        body = "".join(self._iter_html_body(narratives, timestamp or datetime.now()))
+        return _HTML_HEAD_BYTES + body.encode("utf-8")
+    
+    def iter_html(self, narratives: List[Narrative], timestamp: datetime = None) -> Iterator[str]:
+        """Yield the HTML dashboard section by section, e.g. for f.writelines()
+        
+        Only the fragment being rendered is held in memory, never the whole page.
+        """
+        yield _HTML_HEAD
+        yield from self._iter_html_body(narratives, timestamp or datetime.now())
+    
+    def _iter_html_body(self, narratives: List[Narrative], timestamp: datetime) -> Iterator[str]:
+        """Yield everything after the static <head>: stats, narrative cards, action plan"""
+        totals = self._aggregate(narratives)
+        onchain_stats = totals.onchain_stats
+        generated = _format_generated(timestamp)
+        
+        yield _HTML_PAGE_HEADER(
+            narrative_count=len(narratives),
+            total_signals=totals.total_signals,
+            tps=onchain_stats.get('tps', 'N/A'),
+            stablecoins=onchain_stats.get('stablecoins', 'N/A'),
+            updated=generated[11:16]
+        )
+        
+        # Generate narrative cards
+        for narrative, sig_count in zip(narratives, totals.signal_counts):
+            yield from self._iter_card_html(narrative, sig_count)
+        
+        # Action Plan
+        yield """
         </div>
         
         <div class="action-plan">
@@ -819,126 +1032,228 @@ class ReportGenerator:
         
         if narratives:
             top = narratives[0]
-            html += f"""
-            <div class="action-item">
-                <div class="action-number">1</div>
-                <div class="action-content">
-                    <div class="action-title">Highest Priority: {top.name}</div>
-                    <div class="action-desc">Strength {top.strength_score:.0f}/100 with {top.confidence:.0f}% confidence. {f"Start with: {top.build_ideas[0]['name']}" if top.build_ideas else "Strong momentum in this space."}</div>
-                </div>
-            </div>
-"""
+            yield _ACTION_ITEM_TMPL(
+                number=1,
+                title=f"Highest Priority: {top.name}",
+                desc=f"Strength {top.strength_score:.0f}/100 with {top.confidence:.0f}% confidence. "
+                     + (f"Start with: {top.build_ideas[0]['name']}" if top.build_ideas else "Strong momentum in this space.")
+            )
             
             if len(narratives) > 1:
                 second = narratives[1]
-                html += f"""
-            <div class="action-item">
-                <div class="action-number">2</div>
-                <div class="action-content">
-                    <div class="action-title">Secondary Focus: {second.name}</div>
-                    <div class="action-desc">{second.momentum.title()} momentum with solid on-chain validation. Good timing for builders.</div>
-                </div>
-            </div>
-"""
+                yield _ACTION_ITEM_TMPL(
+                    number=2,
+                    title=f"Secondary Focus: {second.name}",
+                    desc=f"{second.momentum.title()} momentum with solid on-chain validation. Good timing for builders."
+                )
             
             if len(narratives) > 2:
-                third = narratives[2]
-                html += f"""
-            <div class="action-item">
-                <div class="action-number">3</div>
-                <div class="action-content">
-                    <div class="action-title">Watch: {third.name}</div>
-                    <div class="action-desc">Emerging opportunity with growing signal strength. Monitor for timing.</div>
+                yield _ACTION_ITEM_TMPL(
+                    number=3,
+                    title=f"Watch: {narratives[2].name}",
+                    desc="Emerging opportunity with growing signal strength. Monitor for timing."
+                )
+        
+        yield _HTML_PAGE_FOOTER(generated=generated)
+        yield _HTML_PAGE_TAIL
+    
+    def _iter_card_html(self, narrative: Narrative, sig_count: int) -> Iterator[str]:
+        """Yield the dashboard card for one narrative"""
+        long_why = len(narrative.why_emerging) > 200
+        yield _NARRATIVE_CARD_TMPL(
+            emoji=self._get_emoji(narrative.category),
+            name=narrative.name,
+            strength=narrative.strength_score,
+            confidence=narrative.confidence,
+            signal_count=sig_count,
+            momentum=narrative.momentum,
+            momentum_icon=_MOMENTUM_ICONS.get(narrative.momentum, "📉"),
+            momentum_label=narrative.momentum.title(),
+            collapsed=_WHY_COLLAPSED[long_why],
+            why=narrative.why_emerging,
+            toggle=_WHY_TOGGLE[long_why]
+        )
+        
+        # Evidence pills
+        if narrative.evidence:
+            yield """
+                <div class="evidence-section">
+                    <div class="evidence-title">Key Evidence:</div>
+                    <div class="evidence-pills">
+"""
+            for ev in narrative.evidence[:4]:
+                yield f'                        <span class="evidence-pill">{ev[:40]}{"..." if len(ev) > 40 else ""}</span>\n'
+            yield """                    </div>
                 </div>
+"""
+        
+        # Build ideas
+        if narrative.build_ideas:
+            yield """
+                <div class="ideas-section">
+                    <div class="ideas-title">💡 Top Build Ideas</div>
+"""
+            for idea in narrative.build_ideas[:2]:
+                yield _IDEA_CARD_TMPL(
+                    name=idea['name'],
+                    description=idea['description'][:120],
+                    difficulty=idea['difficulty'].title(),
+                    time_to_build=idea['time_to_build'],
+                    revenue=idea['potential_revenue'][:30]
+                )
+            yield """                </div>
+"""
+        
+        # Top signals
+        yield """
+                <div class="signals-section">
+                    <div class="signals-title">📡 Recent Signals:</div>
+"""
+        for signal in narrative.signals[:3]:
+            icon = _SOURCE_ICONS.get(signal.source, "📊")
+            title = signal.title[:45] + "..." if len(signal.title) > 45 else signal.title
+            yield f'                    <a href="{signal.url}" class="signal" target="_blank"><span class="signal-icon">{icon}</span> {title}</a>\n'
+        
+        yield """                </div>
             </div>
 """
+    
+    def generate_html_lite(self, narratives: List[Narrative], timestamp: datetime = None) -> str:
+        """Generate the dashboard as a static shell plus a JSON payload
         
-        html += f"""
+        The cards and action plan are rendered in the browser from
+        window.__NARRATIVES, so the server-side cost is one json.dumps.
+        """
+        timestamp = timestamp or datetime.now()
+        totals = self._aggregate(narratives)
+        onchain_stats = totals.onchain_stats
+        generated = _format_generated(timestamp)
+        
+        cards = []
+        for narrative, sig_count in zip(narratives, totals.signal_counts):
+            cards.append({
+                "name": narrative.name,
+                "emoji": self._get_emoji(narrative.category),
+                "score": f"{narrative.strength_score:.0f}",
+                "strength": narrative.strength_score,
+                "confidence": f"{narrative.confidence:.0f}",
+                "signal_count": sig_count,
+                "momentum": narrative.momentum,
+                "momentum_icon": _MOMENTUM_ICONS.get(narrative.momentum, "📉"),
+                "why": narrative.why_emerging,
+                "evidence": narrative.evidence[:4],
+                "ideas": [
+                    {key: idea[key] for key in ("name", "description", "difficulty", "time_to_build", "potential_revenue")}
+                    for idea in narrative.build_ideas[:2]
+                ],
+                "signals": [
+                    {"url": signal.url, "title": signal.title, "icon": _SOURCE_ICONS.get(signal.source, "📊")}
+                    for signal in narrative.signals[:3]
+                ]
+            })
+        
+        actions = []
+        if narratives:
+            top = narratives[0]
+            actions.append({
+                "title": f"Highest Priority: {top.name}",
+                "desc": f"Strength {top.strength_score:.0f}/100 with {top.confidence:.0f}% confidence. "
+                        + (f"Start with: {top.build_ideas[0]['name']}" if top.build_ideas else "Strong momentum in this space.")
+            })
+            if len(narratives) > 1:
+                actions.append({
+                    "title": f"Secondary Focus: {narratives[1].name}",
+                    "desc": f"{narratives[1].momentum.title()} momentum with solid on-chain validation. Good timing for builders."
+                })
+            if len(narratives) > 2:
+                actions.append({
+                    "title": f"Watch: {narratives[2].name}",
+                    "desc": "Emerging opportunity with growing signal strength. Monitor for timing."
+                })
+        
+        # "</" is escaped so a title can never close the <script> early
+        payload = json.dumps(
+            {"narratives": cards, "actions": actions, "generated": generated},
+            separators=(",", ":"), ensure_ascii=False
+        ).replace("</", "<\\/")
+        
+        return "".join((
+            _HTML_HEAD,
+            _HTML_PAGE_HEADER(
+                narrative_count=len(narratives),
+                total_signals=totals.total_signals,
+                tps=onchain_stats.get('tps', 'N/A'),
+                stablecoins=onchain_stats.get('stablecoins', 'N/A'),
+                updated=generated[11:16]
+            ),
+            """
         </div>
         
-        <footer>
-            <p>Generated by <strong>Solana Narrative Radar v2.0</strong></p>
-            <p>Data sources: <a href="https://helius.xyz" target="_blank">Helius API</a> (on-chain), GitHub API, Ecosystem Research</p>
-            <p>Report generated: {timestamp.strftime('%Y-%m-%d %H:%M UTC')}</p>
-        </footer>
-    </div>
-    
-    <script>
-        function toggleWhy(btn) {{
-            const content = btn.previousElementSibling;
-            const isCollapsed = content.classList.contains('collapsed');
-            
-            if (isCollapsed) {{
-                content.classList.remove('collapsed');
-                btn.classList.add('expanded');
-                btn.querySelector('span:first-child').textContent = 'Show less';
-            }} else {{
-                content.classList.add('collapsed');
-                btn.classList.remove('expanded');
-                btn.querySelector('span:first-child').textContent = 'Read more';
-            }}
-        }}
-    </script>
-</body>
-</html>
-"""
-        return html
+        <div class="action-plan">
+            <h2>🚀 Recommended Action Plan</h2>
+        </div>
+        
+        <script>window.__NARRATIVES = """,
+            payload,
+            ";</script>",
+            _HTML_LITE_RENDERER,
+            # The footer opens by closing a <div>; the action plan above is
+            # already closed, so drop that one tag
+            _HTML_PAGE_FOOTER(generated=generated).replace("\n        </div>\n", "\n", 1),
+            _HTML_PAGE_TAIL
+        ))
     
     def _get_emoji(self, category: str) -> str:
         """Get emoji for narrative category"""
-        emojis = {
-            "ai_agents": "🤖",
-            "infrastructure": "🏗️",
-            "stablecoins_payfi": "💵",
-            "rwa_tokenization": "🏦",
-            "mobile_consumer": "📱",
-            "depin": "🌐",
-            "memecoins": "🐸",
-            "defi_evolution": "💱",
-            "zk_compression": "🔐"
-        }
-        return emojis.get(category, "📊")
+        return _CATEGORY_EMOJI.get(category, "📊")
     
-    def _get_onchain_summary(self, narratives: List[Narrative]) -> Dict[str, str]:
-        """Extract on-chain stats summary from narratives"""
+    def _aggregate(self, narratives: List[Narrative]) -> _ReportAggregates:
+        """Count signals and extract the on-chain stats summary in one pass"""
+        memo = self._totals_memo
+        if memo is not None and memo[0] == tuple(map(id, narratives)):
+            return memo[1]
+        
+        signal_counts = []
         stats = {"tps": "N/A", "stablecoins": "N/A"}
         
         for narrative in narratives:
+            signal_counts.append(len(narrative.signals))
             metrics = narrative.key_metrics
             if "tps" in metrics and metrics["tps"]:
                 stats["tps"] = f"{metrics['tps']:,}"
             if "total_supply_usd" in metrics and metrics["total_supply_usd"]:
                 stats["stablecoins"] = f"${metrics['total_supply_usd']/1e9:.1f}B"
         
-        return stats
+        return _ReportAggregates(sum(signal_counts), signal_counts, stats)
     
     def save_reports(self, narratives: List[Narrative]) -> Dict[str, str]:
         """Save HTML, Markdown, and JSON reports"""
         timestamp = datetime.now()
         
-        # Generate reports
-        md_content = self.generate_markdown(narratives, timestamp)
-        html_content = self.generate_html(narratives, timestamp)
+        # Generate reports; both render the same list, so aggregate it once
+        totals = self._aggregate(narratives)
+        self._totals_memo = (tuple(map(id, narratives)), totals)
+        try:
+            md_content = self.generate_markdown(narratives, timestamp)
+            html_content = self.generate_html_bytes(narratives, timestamp)
+        finally:
+            self._totals_memo = None
         
         # Save files
         md_path = os.path.join(self.output_dir, "narrative_report.md")
         html_path = os.path.join(self.output_dir, "narrative_report.html")
         
-        with open(md_path, "w") as f:
-            f.write(md_content)
+        _write_text(md_path, md_content)
+        _write_bytes(html_path, html_content)
         
-        with open(html_path, "w") as f:
-            f.write(html_content)
-        
-        # Also save JSON data
+        # Also save JSON data; json.dump would write each encoder chunk separately
         json_path = os.path.join(self.output_dir, "narrative_data.json")
-        with open(json_path, "w") as f:
-            json.dump({
-                "version": "2.0",
-                "timestamp": timestamp.isoformat(),
-                "total_signals": sum(len(n.signals) for n in narratives),
-                "narratives": [n.to_dict() for n in narratives]
-            }, f, indent=2)
+        _write_text(json_path, json.dumps({
+            "version": "2.0",
+            "timestamp": timestamp.isoformat(),
+            "total_signals": totals.total_signals,
+            "narratives": [n.to_dict() for n in narratives]
+        }, indent=2))
         
         return {
             "markdown": md_path,
@@ -948,10 +1263,13 @@ class ReportGenerator:
 
 
 if __name__ == "__main__":
+    import logging
     from signal_fetcher import fetch_all_signals
     from narrative_detector import detect_narratives
     from idea_generator import generate_all_ideas
     
+    logging.basicConfig(level=logging.INFO, format="    %(message)s")
+    
     # Full pipeline
     signals = fetch_all_signals()
     detector = detect_narratives(signals)
@@ -1,20 +1,43 @@
 """Signal Fetcher - Collects signals from various sources including on-chain data"""
 
+import functools
+import gzip
+import hashlib
 import json
+import logging
 import urllib.request
 import urllib.error
 import urllib.parse
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from itertools import repeat
+from typing import List, Dict, Any, Callable, Optional, Tuple
 import ssl
 
+from config import OUTPUT_DIR, normalize
+
+log = logging.getLogger(__name__)
+
 # Disable SSL verification for simple fetches (not recommended for production)
 ssl._create_default_https_context = ssl._create_unverified_context
 
+# GitHub search responses are cached on disk between runs
+GITHUB_CACHE_DIR = os.path.join(OUTPUT_DIR, ".github_cache")
+
+# GitHub timestamps end in "Z", which fromisoformat only accepts from 3.11 on
+if sys.version_info >= (3, 11):
+    _parse_github_timestamp = datetime.fromisoformat
+else:
+    def _parse_github_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
-def load_env_vars():
-    """Load environment variables from .env file"""
+
+@functools.lru_cache(maxsize=1)
+def load_env_vars() -> Dict[str, str]:
+    """Load environment variables from .env files, parsed once per process"""
     env_vars = {}
     env_paths = [
         os.path.join(os.path.dirname(__file__), ".env"),
@@ -33,11 +56,15 @@ def load_env_vars():
     return env_vars
 
 
-ENV_VARS = load_env_vars()
-
-
 class Signal:
-    """Represents a single signal from the ecosystem"""
+    """Represents a single signal from the ecosystem; slotted since a run builds hundreds"""
+    
+    __slots__ = (
+        "source", "title", "description", "url", "timestamp", "metadata",
+        "narrative_tags", "relevance_score",
+        # Lazily derived match keys, filled on first access
+        "_naive_timestamp", "_match_text", "_match_topics",
+    )
     
     def __init__(
         self,
@@ -56,6 +83,32 @@ class Signal:
         self.metadata = metadata or {}
         self.narrative_tags = []
         self.relevance_score = 0.0
+        self._naive_timestamp = None
+        self._match_text = None
+        self._match_topics = None
+    
+    # Slotted classes have no __dict__ for functools.cached_property, so the
+    # derived keys are cached in their own slots instead
+    @property
+    def naive_timestamp(self) -> datetime:
+        """Timestamp without tzinfo, so it compares with local datetime.now()"""
+        if self._naive_timestamp is None:
+            self._naive_timestamp = self.timestamp.replace(tzinfo=None) if self.timestamp.tzinfo else self.timestamp
+        return self._naive_timestamp
+    
+    @property
+    def match_text(self) -> str:
+        """Title and description normalized for keyword matching, computed once"""
+        if self._match_text is None:
+            self._match_text = normalize(f"{self.title} {self.description}")
+        return self._match_text
+    
+    @property
+    def match_topics(self) -> List[str]:
+        """GitHub topics normalized for keyword matching, computed once"""
+        if self._match_topics is None:
+            self._match_topics = [normalize(topic) for topic in self.metadata.get("topics", [])]
+        return self._match_topics
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -74,22 +127,34 @@ class GitHubFetcher:
     """Fetches trending Solana repositories from GitHub with authentication"""
     
     BASE_URL = "https://api.github.com"
+    SEARCH_TTL = 3600  # seconds; trending results barely move within an hour
     
-    def __init__(self, token: str = None):
-        self.token = token or ENV_VARS.get("GITHUB_ACCESS_TOKEN", "")
+    def __init__(self, token: str = None, use_cache: bool = True):
+        # The process environment wins; the .env files are only read on a miss
+        self.token = (
+            token
+            or os.environ.get("GITHUB_ACCESS_TOKEN")
+            or load_env_vars().get("GITHUB_ACCESS_TOKEN", "")
+        )
+        self.use_cache = use_cache
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
+            # Search results are large, repetitive JSON; gzip cuts them several-fold
+            "Accept-Encoding": "gzip",
             "User-Agent": "SolanaNarrativeRadar/2.0"
         }
+        # Set by the first search that gets a 403; later searches are skipped
+        self._rate_limited = False
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
-            print("    ├── GitHub API: Authenticated ✓")
+            log.info("GitHub API: authenticated")
         else:
-            print("    ├── GitHub API: Unauthenticated (rate limited)")
+            log.info("GitHub API: unauthenticated (rate limited)")
     
     def fetch_trending_repos(self, days: int = 14, limit: int = 50) -> List[Signal]:
         """Fetch recently created/updated Solana repos"""
-        signals = []
+        # Keyed by repo URL: queries overlap, so dedupe while collecting
+        signals: Dict[str, Signal] = {}
         
         # Search for Solana-related repos with different queries
         queries = [
@@ -103,304 +168,409 @@ class GitHubFetcher:
         ]
         
         since_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        search_urls = [
+            f"{self.BASE_URL}/search/repositories"
+            f"?q={urllib.parse.quote(query.format(date=since_date))}"
+            f"&sort=updated&order=desc&per_page={limit}"
+            for query in queries
+        ]
         
-        for query in queries:
-            query_formatted = query.format(date=since_date)
-            try:
-                search_url = (
-                    f"{self.BASE_URL}/search/repositories"
-                    f"?q={urllib.parse.quote(query_formatted)}"
-                    f"&sort=updated&order=desc&per_page={limit}"
-                )
-                
-                req = urllib.request.Request(search_url, headers=self.headers)
-                with urllib.request.urlopen(req, timeout=15) as response:
-                    data = json.loads(response.read().decode())
-                    
-                    for repo in data.get("items", [])[:limit]:
-                        # Skip archived or fork repos for better signal quality
-                        if repo.get("archived") or repo.get("fork"):
-                            continue
-                        
-                        signal = Signal(
-                            source="github",
-                            title=repo.get("full_name", ""),
-                            description=repo.get("description", "") or "No description",
-                            url=repo.get("html_url", ""),
-                            timestamp=datetime.fromisoformat(
-                                repo.get("pushed_at", "").replace("Z", "+00:00")
-                            ),
-                            metadata={
-                                "stars": repo.get("stargazers_count", 0),
-                                "forks": repo.get("forks_count", 0),
-                                "language": repo.get("language", ""),
-                                "topics": repo.get("topics", []),
-                                "open_issues": repo.get("open_issues_count", 0),
-                                "watchers": repo.get("watchers_count", 0),
-                                "created_at": repo.get("created_at", ""),
-                            }
-                        )
-                        signals.append(signal)
-                        
-            except urllib.error.HTTPError as e:
-                if e.code == 403:
-                    print(f"    ⚠️ GitHub rate limit hit, using cached data")
-                    break
-                print(f"    ⚠️ GitHub HTTP error for '{query}': {e}")
-            except Exception as e:
-                print(f"    ⚠️ GitHub error for '{query}': {e}")
-        
-        # Deduplicate by URL and sort by stars
-        seen_urls = set()
-        unique_signals = []
-        for s in signals:
-            if s.url not in seen_urls:
-                seen_urls.add(s.url)
-                unique_signals.append(s)
+        # The searches are independent and network-bound, so run them all at
+        # once; map() keeps query order, so deduplication and the warnings
+        # below come out as they did when the searches ran one by one
+        self._rate_limited = False
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            results = executor.map(self._fetch_query, queries, search_urls, repeat(limit))
+            for repos, warning in results:
+                for repo in repos:
+                    # Keep the first copy unless a later one reports more stars;
+                    # checked on the raw repo so duplicates never become Signals
+                    url = repo.get("html_url", "")
+                    existing = signals.get(url)
+                    if existing is None or (repo.get("stargazers_count") or 0) > existing.metadata["stars"]:
+                        try:
+                            signals[url] = self._repo_signal(repo)
+                        except Exception as e:
+                            # One malformed item must not cost the other results
+                            log.warning("Skipping GitHub repo %r: %s", url, e)
+                if warning:
+                    log.warning("%s", warning)
+        if self._rate_limited:
+            log.warning("GitHub rate limit hit, using cached data")
         
         # Sort by stars for quality ranking
-        unique_signals.sort(key=lambda x: x.metadata.get("stars", 0), reverse=True)
+        unique_signals = sorted(signals.values(), key=lambda x: x.metadata["stars"], reverse=True)
         
         return unique_signals[:limit]
+    
+    def _fetch_query(self, query: str, search_url: str, limit: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Run one repository search, returning its usable repos and any warning to log
+        
+        Once a search has been rate limited, searches that have not started yet
+        are skipped.
+        """
+        repos = []
+        if self._rate_limited:
+            return repos, None
+        
+        try:
+            data, etag = self._cache_get(search_url)
+            if data is None or etag is not None:
+                data = self._request_search(search_url, data, etag)
+            
+            for repo in data.get("items", [])[:limit]:
+                # Skip archived or fork repos for better signal quality
+                if repo.get("archived") or repo.get("fork"):
+                    continue
+                repos.append(repo)
+                
+        except urllib.error.HTTPError as e:
+            if e.code == 403:
+                self._rate_limited = True
+                return repos, None
+            return repos, f"GitHub HTTP error for {query!r}: {e}"
+        except Exception as e:
+            return repos, f"GitHub error for {query!r}: {e}"
+        
+        return repos, None
+    
+    @staticmethod
+    def _repo_signal(repo: Dict[str, Any]) -> Signal:
+        """Build the Signal for one search result"""
+        pushed_at = repo.get("pushed_at")
+        return Signal(
+            source="github",
+            title=repo.get("full_name", ""),
+            description=repo.get("description", "") or "No description",
+            url=repo.get("html_url", ""),
+            timestamp=_parse_github_timestamp(pushed_at) if pushed_at else datetime.now(),
+            metadata={
+                "stars": repo.get("stargazers_count") or 0,
+                "forks": repo.get("forks_count", 0),
+                "language": repo.get("language", ""),
+                "topics": repo.get("topics", []),
+                "open_issues": repo.get("open_issues_count", 0),
+                "watchers": repo.get("watchers_count", 0),
+                "created_at": repo.get("created_at", ""),
+            }
+        )
+    
+    def _request_search(self, search_url: str, cached: Optional[Dict[str, Any]],
+                        etag: Optional[str]) -> Dict[str, Any]:
+        """Fetch a search response, revalidating an expired cache entry by ETag
+        
+        GitHub answers an unchanged search with 304 Not Modified, which does not
+        count against the search rate limit, so the stale copy is reused.
+        """
+        headers = self.headers
+        if etag:
+            headers = dict(headers, **{"If-None-Match": etag})
+        req = urllib.request.Request(search_url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=15) as response:
+                body = response.read()
+                if response.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                data = json.loads(body)  # bytes in; json detects the UTF-8 itself
+                etag = response.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or cached is None:
+                raise
+            data = cached
+        self._cache_put(search_url, data, etag)
+        return data
+    
+    def _cache_path(self, search_url: str) -> str:
+        """Cache file for one search request"""
+        return os.path.join(GITHUB_CACHE_DIR, f"{hashlib.sha1(search_url.encode()).hexdigest()}.json")
+    
+    def _cache_get(self, search_url: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Return (response, etag) for a cached search
+        
+        A response younger than SEARCH_TTL comes back with etag None and is used
+        as is; an older one comes back with its ETag so it can be revalidated.
+        """
+        if not self.use_cache:
+            return None, None
+        path = self._cache_path(search_url)
+        try:
+            fresh = time.time() - os.path.getmtime(path) <= self.SEARCH_TTL
+            with open(path) as f:
+                entry = json.load(f)
+            data, etag = entry["data"], entry.get("etag")
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, None
+        if fresh:
+            return data, None
+        return (data, etag) if etag else (None, None)
+    
+    def _cache_put(self, search_url: str, data: Dict[str, Any], etag: Optional[str] = None):
+        """Persist a search response; caching is best-effort and never fails a run"""
+        if not self.use_cache:
+            return
+        path = self._cache_path(search_url)
+        try:
+            os.makedirs(GITHUB_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"etag": etag, "data": data}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=1)
+def _helius_fetch_signals() -> Callable[..., list]:
+    """Import the Helius fetcher on first use, once per process"""
+    from helius_fetcher import fetch_helius_signals
+    return fetch_helius_signals
 
 
 class HeliusSignalAdapter:
     """Adapts Helius on-chain signals to Signal format"""
     
-    def __init__(self):
-        from helius_fetcher import fetch_helius_signals
-        self.fetch_signals = fetch_helius_signals
+    def __init__(self, use_cache: bool = True):
+        self.use_cache = use_cache
+        self.fetch_signals = _helius_fetch_signals()
     
     def get_signals(self) -> List[Signal]:
         """Convert Helius data to Signal objects"""
         signals = []
         
         try:
-            helius_data = self.fetch_signals()
+            helius_data = self.fetch_signals(use_cache=self.use_cache)
+            # Every signal in a batch shares the fetch time
+            now = datetime.now()
             
             for data in helius_data:
                 signal = Signal(
-                    source="helius_onchain",
-                    title=data["title"],
-                    description=data["description"],
+                    source=data.source,
+                    title=data.title,
+                    description=data.description,
                     url="https://solscan.io",  # Link to Solscan for exploration
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     metadata={
-                        "category": data.get("category", ""),
-                        "metrics": data.get("metrics", {}),
-                        "signal_strength": data.get("signal_strength", "medium"),
-                        "evidence": [data["description"][:100]]
+                        "category": data.category,
+                        "metrics": data.metrics,
+                        "signal_strength": data.signal_strength,
+                        "evidence": [data.description[:100]]
                     }
                 )
                 signals.append(signal)
         except Exception as e:
-            print(f"    ⚠️ Helius adapter error: {e}")
+            log.warning("Helius adapter error: %s", e)
         
         return signals
 
 
+# Pre-researched signals with narrative explanations; built once at import
+# and shared read-only by every ResearchSignalGenerator
+_RESEARCH_DATA: Tuple[Dict[str, Any], ...] = (
+    # AI Agents Narrative - WHY IT'S EMERGING
+    {
+        "source": "research",
+        "title": "ai16z Autonomous Trading Swarms Reshape Solana DeFi",
+        "description": "ai16z's flagship agent 'Marc AIndreessen' processes thousands of social signals per second. The convergence of LLMs + DeFi + Solana's speed creates perfect conditions for autonomous finance.",
+        "url": "https://markets.financialcontent.com/stocks/article/tokenring-2026-2-6-the-rise-of-agentic-capital",
+        "category": "ai_agents",
+        "evidence": ["ai16z market cap $2B+", "Autonomous trading swarms active", "Solana Agent Kit 60+ actions"],
+        "why_emerging": "LLMs reached capability threshold for autonomous decision-making. Solana's sub-second finality enables real-time agent execution. ai16z proved the model works with $100M+ AUM."
+    },
+    {
+        "source": "research", 
+        "title": "Solana Agent Kit: 60+ Pre-built Actions for AI Development",
+        "description": "SendAI's Solana Agent Kit provides token operations, NFT minting, DeFi interactions. Four major frameworks (Eliza, Rig, ZerePy, Arc) now compete for developer mindshare.",
+        "url": "https://www.alchemy.com/blog/how-to-build-solana-ai-agents-in-2026",
+        "category": "ai_agents",
+        "evidence": ["60+ pre-built actions", "4 competing frameworks", "Token ops + DeFi + NFTs"],
+        "why_emerging": "Developer tooling matured. Pre-built actions lower barrier to entry from months to days. Ecosystem standardizing around interoperable agent protocols."
+    },
+    {
+        "source": "research",
+        "title": "OpenAI + Anthropic Agents Enter Web3 via Solana",
+        "description": "Major AI labs partnering with Solana projects. Claude and GPT-4 agents now operate on-chain wallets autonomously. AI-to-AI commerce becoming reality.",
+        "url": "https://www.hokanews.com/2026/02/openclaw-ai-suddenly-explodes-after.html",
+        "category": "ai_agents",
+        "evidence": ["AI lab partnerships", "Autonomous wallet control", "AI-to-AI transactions"],
+        "why_emerging": "Foundation model capabilities now sufficient for financial autonomy. Solana's low fees make AI micropayments economically viable."
+    },
+    # Infrastructure Narrative - WHY IT'S EMERGING
+    {
+        "source": "research",
+        "title": "Firedancer Targets 1M TPS on Solana Mainnet",
+        "description": "Jump Crypto's Firedancer validator client aims for 1M TPS by mid-2026. Written in C for maximum performance, it's the most ambitious blockchain upgrade ever attempted.",
+        "url": "https://coindoo.com/best-crypto-to-buy-during-market-crash",
+        "category": "infrastructure",
+        "evidence": ["1M TPS target", "Jump Crypto backing", "C implementation", "Mainnet testing active"],
+        "why_emerging": "Previous cycle exposed congestion issues. Institutional adoption requires enterprise-grade performance. Competition from L2s and new L1s driving urgency."
+    },
+    {
+        "source": "research",
+        "title": "Alpenglow: 150ms Block Finality Coming to Solana",
+        "description": "Alpenglow consensus upgrade reduces finality from ~12 seconds to 150 milliseconds. Positions Solana as 'Decentralized Nasdaq' for high-frequency trading.",
+        "url": "https://www.disruptionbanking.com/2026/01/20/how-strong-will-solana-be-in-2026/",
+        "category": "infrastructure",
+        "evidence": ["150ms finality", "80x improvement", "HFT compatibility", "Decentralized Nasdaq positioning"],
+        "why_emerging": "TradFi integration requires finality guarantees. 12-second finality was blocking institutional adoption. Alpenglow unlocks new use cases (HFT, options, payments)."
+    },
+    {
+        "source": "research",
+        "title": "ZK Compression v2: 1000x State Cost Reduction",
+        "description": "ZK Compression v2 compresses state data by 1000x via Merkle trees. Light Protocol leads implementation. Game-changer for NFT collections and airdrop campaigns.",
+        "url": "https://letstalkbitco.in/solanas-v3-0-14-update-targets-mainnet-stability",
+        "category": "infrastructure",
+        "evidence": ["1000x compression", "Light Protocol", "Reduced validator costs"],
+        "why_emerging": "State rent was blocking mass adoption experiments. Compressed NFTs proved concept. Now generalizing to all account types."
+    },
+    # Stablecoins & PayFi - WHY IT'S EMERGING
+    {
+        "source": "research",
+        "title": "$5B+ USDC on Solana: Stablecoin Dominance",
+        "description": "Stablecoin supply crossed $5B milestone with $1B USDC minted in 8 hours. Solana now #2 for stablecoin activity behind Ethereum. PayFi infrastructure maturing.",
+        "url": "https://www.hokanews.com/2026/01/1-billion-usdc-minted-on-solana-in.html",
+        "category": "stablecoins_payfi",
+        "evidence": ["$5B+ supply", "$1B single-day mint", "#2 stablecoin chain"],
+        "why_emerging": "Circle prioritizing Solana for USDC expansion. Low fees make micropayments viable. AI agents driving automated payment flows."
+    },
+    {
+        "source": "research",
+        "title": "Western Union USDPT Stablecoin on Solana",
+        "description": "175-year-old payments giant Western Union announces USDPT stablecoin on Solana via Anchorage Digital. H1 2026 launch targets $700B remittance market.",
+        "url": "https://www.disruptionbanking.com/2026/01/20/how-strong-will-solana-be-in-2026/",
+        "category": "stablecoins_payfi",
+        "evidence": ["Western Union", "USDPT", "$700B market", "Anchorage custody"],
+        "why_emerging": "Regulatory clarity emerging. Solana's speed matches remittance UX expectations. Legacy players forced to compete with crypto-native rails."
+    },
+    {
+        "source": "research",
+        "title": "Visa + Mastercard Settlement on Solana",
+        "description": "Visa expanded stablecoin settlement to Solana. Mastercard piloting merchant settlements. Payment giants validating Solana as enterprise-grade rails.",
+        "url": "https://www.dlnews.com/articles/markets/why-solana-stablecoin-action-boomed/",
+        "category": "stablecoins_payfi",
+        "evidence": ["Visa settlement live", "Mastercard pilot", "Enterprise validation"],
+        "why_emerging": "Card networks see blockchain as cost reduction. Solana's proven uptime and speed meet enterprise SLAs. First-mover advantage in B2B payments."
+    },
+    # RWA Tokenization - WHY IT'S EMERGING
+    {
+        "source": "research",
+        "title": "Ondo Finance: 200+ Tokenized Assets on Solana",
+        "description": "Ondo launches 200+ tokenized stocks, ETFs, bonds on Solana. Largest RWA issuer by asset count. Controls 65% of individual tokenized RWA market.",
+        "url": "https://www.coindesk.com/business/2026/01/21/ondo-finance-brings-200-tokenized-u-s-stocks-and-etfs-to-solana",
+        "category": "rwa_tokenization",
+        "evidence": ["200+ assets", "65% market share", "Stocks + ETFs + Bonds"],
+        "why_emerging": "SEC clarity on tokenized securities. TradFi demand for 24/7 markets. Solana's compliance-ready infrastructure (AML, KYC hooks)."
+    },
+    {
+        "source": "research",
+        "title": "Tokenized Equities Market Explodes 2800% to $963M",
+        "description": "Tokenized equities market reaches $963M in January 2026, up 2800% YoY. Regulatory tailwinds and institutional demand driving explosive growth.",
+        "url": "https://www.coindesk.com/business/2026/01/30/tokenized-equities-exploded-3000-percent",
+        "category": "rwa_tokenization",
+        "evidence": ["$963M market", "2800% YoY growth", "Institutional demand"],
+        "why_emerging": "BlackRock and Fidelity entering space. 24/7 trading demand from global investors. T+0 settlement superior to T+2 traditional."
+    },
+    {
+        "source": "research",
+        "title": "WisdomTree Tokenized Funds on Solana",
+        "description": "WisdomTree brings full suite of tokenized funds to Solana as RWA surpasses $1B. ETF giant validates blockchain for asset management.",
+        "url": "https://www.businesswire.com/news/home/20260128885072/en/WisdomTree-Expands-Tokenization-to-Solana",
+        "category": "rwa_tokenization",
+        "evidence": ["WisdomTree", "$1B+ RWA", "ETF-grade products"],
+        "why_emerging": "Traditional asset managers can't ignore on-chain efficiency. Solana winning institutional deals over Ethereum for cost/speed."
+    },
+    # Mobile/Consumer - WHY IT'S EMERGING
+    {
+        "source": "research",
+        "title": "Solana Seeker: 150K+ Preorders, SKR Token Launch",
+        "description": "Solana Mobile's Seeker phone launches with 150K+ preorders. 1.8B SKR token airdrop creates new hardware-gated distribution model.",
+        "url": "https://www.theblock.co/post/386449/solana-mobile-seeker-skr-token-airdrop",
+        "category": "mobile_consumer",
+        "evidence": ["150K preorders", "1.8B token airdrop", "Hardware-gated airdrops"],
+        "why_emerging": "Saga success proved demand. Hardware wallets solve UX. Token airdrops subsidize consumer adoption. Web3 phone becomes trojan horse."
+    },
+    {
+        "source": "research",
+        "title": "Mobile DeFi Usage Surges on Solana",
+        "description": "40% of Solana DEX trades now originate from mobile. Phantom and Jupiter mobile apps seeing record usage. Consumer UX finally reaching parity.",
+        "url": "https://cryptomaniaks.com/news/solana-seeker-review-skr-token-staking-apy",
+        "category": "mobile_consumer",
+        "evidence": ["40% mobile DEX trades", "Record app usage", "UX parity achieved"],
+        "why_emerging": "Mobile-first generation entering crypto. Wallet UX dramatically improved. Native dApp stores bypass Apple/Google restrictions."
+    },
+    # DePIN - WHY IT'S EMERGING
+    {
+        "source": "research",
+        "title": "Dawn Network: DePIN Internet Sharing Explodes",
+        "description": "Dawn Network allows bandwidth sharing via rooftop hardware. 50K+ nodes active. DePIN model proving real-world infrastructure can decentralize.",
+        "url": "https://www.hokanews.com/2026/01/dawn-network-airdrop-stays-hot.html",
+        "category": "depin",
+        "evidence": ["50K+ nodes", "Bandwidth sharing", "Real-world infrastructure"],
+        "why_emerging": "Hardware costs dropped. Token incentives align contributors. Solana's speed enables real-time IoT coordination. Helium proved model works."
+    },
+    {
+        "source": "research",
+        "title": "DePIN TVL Crosses $5B on Solana",
+        "description": "Combined DePIN total value (Render, Helium, io.net, Nosana, Hivemapper) crosses $5B. GPU compute and wireless leading categories.",
+        "url": "https://investinghaven.com/solana-sol-price-predictions/",
+        "category": "depin",
+        "evidence": ["$5B+ DePIN TVL", "GPU + Wireless focus", "5 major protocols"],
+        "why_emerging": "AI training demand outstripping centralized supply. Decentralized compute 60% cheaper. Geographic distribution = resilience."
+    },
+    # Memecoins - WHY IT'S EMERGING (still!)
+    {
+        "source": "research",
+        "title": "Pump.fun: 300K Daily Users, 39K Tokens/Day",
+        "description": "Pump.fun dominates Solana meme ecosystem. 300K daily active addresses. 39K token creations in single day. PUMP token up 34%.",
+        "url": "https://www.bitget.com/news/detail/12560605178213",
+        "category": "memecoins",
+        "evidence": ["300K DAU", "39K tokens/day", "PUMP +34%"],
+        "why_emerging": "Bonding curve innovation removed rug risk. Low friction = high velocity. Cultural moment for meme trading. Solana speed = better trading UX."
+    },
+    {
+        "source": "research",
+        "title": "Meme Launchpad Volume Hits $180M Single Day",
+        "description": "Solana token launchpad volume reached $180M on Jan 26, 2026. Meme season showing no signs of slowing despite market volatility.",
+        "url": "https://finance.yahoo.com/news/solana-news-sol-slides-shutdown-155002508.html",
+        "category": "memecoins",
+        "evidence": ["$180M daily volume", "Sustained momentum", "Volatility-resistant"],
+        "why_emerging": "Cultural narrative stronger than fundamentals. Low barrier to participation. Community-driven price discovery. Entertainment value."
+    },
+    # DeFi Evolution
+    {
+        "source": "research",
+        "title": "Jupiter: #1 DEX Aggregator Processes $100B+ Volume",
+        "description": "Jupiter processed over $100B cumulative volume. Perp DEX launched. JUP staking and governance creating DeFi flywheel.",
+        "url": "https://www.jupiter.ag",
+        "category": "defi_evolution",
+        "evidence": ["$100B+ volume", "Perp launch", "JUP staking"],
+        "why_emerging": "Aggregation layer becoming essential. Perp demand from CEX refugees. DAO governance engaging community."
+    },
+    {
+        "source": "research",
+        "title": "Liquid Staking Wars: jitoSOL vs mSOL vs bSOL",
+        "description": "Liquid staking competition intensifies. Jito pioneered MEV rewards. Marinade largest by TVL. New entrants differentiating on yield and governance.",
+        "url": "https://defillama.com/chain/Solana",
+        "category": "defi_evolution",
+        "evidence": ["$3B+ LST TVL", "MEV rewards", "Yield competition"],
+        "why_emerging": "Ethereum showed LST potential. MEV extraction profitable. Staking = passive income for holders."
+    },
+)
+
+
 class ResearchSignalGenerator:
     """Generates signals from pre-researched data (curated insights)"""
     
     def __init__(self):
         self.research_data = self._load_research_data()
     
-    def _load_research_data(self) -> List[Dict[str, Any]]:
+    def _load_research_data(self) -> Tuple[Dict[str, Any], ...]:
         """Load pre-researched signals with narrative explanations"""
-        return [
-            # AI Agents Narrative - WHY IT'S EMERGING
-            {
-                "source": "research",
-                "title": "ai16z Autonomous Trading Swarms Reshape Solana DeFi",
-                "description": "ai16z's flagship agent 'Marc AIndreessen' processes thousands of social signals per second. The convergence of LLMs + DeFi + Solana's speed creates perfect conditions for autonomous finance.",
-                "url": "https://markets.financialcontent.com/stocks/article/tokenring-2026-2-6-the-rise-of-agentic-capital",
-                "category": "ai_agents",
-                "evidence": ["ai16z market cap $2B+", "Autonomous trading swarms active", "Solana Agent Kit 60+ actions"],
-                "why_emerging": "LLMs reached capability threshold for autonomous decision-making. Solana's sub-second finality enables real-time agent execution. ai16z proved the model works with $100M+ AUM."
-            },
-            {
-                "source": "research", 
-                "title": "Solana Agent Kit: 60+ Pre-built Actions for AI Development",
-                "description": "SendAI's Solana Agent Kit provides token operations, NFT minting, DeFi interactions. Four major frameworks (Eliza, Rig, ZerePy, Arc) now compete for developer mindshare.",
-                "url": "https://www.alchemy.com/blog/how-to-build-solana-ai-agents-in-2026",
-                "category": "ai_agents",
-                "evidence": ["60+ pre-built actions", "4 competing frameworks", "Token ops + DeFi + NFTs"],
-                "why_emerging": "Developer tooling matured. Pre-built actions lower barrier to entry from months to days. Ecosystem standardizing around interoperable agent protocols."
-            },
-            {
-                "source": "research",
-                "title": "OpenAI + Anthropic Agents Enter Web3 via Solana",
-                "description": "Major AI labs partnering with Solana projects. Claude and GPT-4 agents now operate on-chain wallets autonomously. AI-to-AI commerce becoming reality.",
-                "url": "https://www.hokanews.com/2026/02/openclaw-ai-suddenly-explodes-after.html",
-                "category": "ai_agents",
-                "evidence": ["AI lab partnerships", "Autonomous wallet control", "AI-to-AI transactions"],
-                "why_emerging": "Foundation model capabilities now sufficient for financial autonomy. Solana's low fees make AI micropayments economically viable."
-            },
-            # Infrastructure Narrative - WHY IT'S EMERGING
-            {
-                "source": "research",
-                "title": "Firedancer Targets 1M TPS on Solana Mainnet",
-                "description": "Jump Crypto's Firedancer validator client aims for 1M TPS by mid-2026. Written in C for maximum performance, it's the most ambitious blockchain upgrade ever attempted.",
-                "url": "https://coindoo.com/best-crypto-to-buy-during-market-crash",
-                "category": "infrastructure",
-                "evidence": ["1M TPS target", "Jump Crypto backing", "C implementation", "Mainnet testing active"],
-                "why_emerging": "Previous cycle exposed congestion issues. Institutional adoption requires enterprise-grade performance. Competition from L2s and new L1s driving urgency."
-            },
-            {
-                "source": "research",
-                "title": "Alpenglow: 150ms Block Finality Coming to Solana",
-                "description": "Alpenglow consensus upgrade reduces finality from ~12 seconds to 150 milliseconds. Positions Solana as 'Decentralized Nasdaq' for high-frequency trading.",
-                "url": "https://www.disruptionbanking.com/2026/01/20/how-strong-will-solana-be-in-2026/",
-                "category": "infrastructure",
-                "evidence": ["150ms finality", "80x improvement", "HFT compatibility", "Decentralized Nasdaq positioning"],
-                "why_emerging": "TradFi integration requires finality guarantees. 12-second finality was blocking institutional adoption. Alpenglow unlocks new use cases (HFT, options, payments)."
-            },
-            {
-                "source": "research",
-                "title": "ZK Compression v2: 1000x State Cost Reduction",
-                "description": "ZK Compression v2 compresses state data by 1000x via Merkle trees. Light Protocol leads implementation. Game-changer for NFT collections and airdrop campaigns.",
-                "url": "https://letstalkbitco.in/solanas-v3-0-14-update-targets-mainnet-stability",
-                "category": "infrastructure",
-                "evidence": ["1000x compression", "Light Protocol", "Reduced validator costs"],
-                "why_emerging": "State rent was blocking mass adoption experiments. Compressed NFTs proved concept. Now generalizing to all account types."
-            },
-            # Stablecoins & PayFi - WHY IT'S EMERGING
-            {
-                "source": "research",
-                "title": "$5B+ USDC on Solana: Stablecoin Dominance",
-                "description": "Stablecoin supply crossed $5B milestone with $1B USDC minted in 8 hours. Solana now #2 for stablecoin activity behind Ethereum. PayFi infrastructure maturing.",
-                "url": "https://www.hokanews.com/2026/01/1-billion-usdc-minted-on-solana-in.html",
-                "category": "stablecoins_payfi",
-                "evidence": ["$5B+ supply", "$1B single-day mint", "#2 stablecoin chain"],
-                "why_emerging": "Circle prioritizing Solana for USDC expansion. Low fees make micropayments viable. AI agents driving automated payment flows."
-            },
-            {
-                "source": "research",
-                "title": "Western Union USDPT Stablecoin on Solana",
-                "description": "175-year-old payments giant Western Union announces USDPT stablecoin on Solana via Anchorage Digital. H1 2026 launch targets $700B remittance market.",
-                "url": "https://www.disruptionbanking.com/2026/01/20/how-strong-will-solana-be-in-2026/",
-                "category": "stablecoins_payfi",
-                "evidence": ["Western Union", "USDPT", "$700B market", "Anchorage custody"],
-                "why_emerging": "Regulatory clarity emerging. Solana's speed matches remittance UX expectations. Legacy players forced to compete with crypto-native rails."
-            },
-            {
-                "source": "research",
-                "title": "Visa + Mastercard Settlement on Solana",
-                "description": "Visa expanded stablecoin settlement to Solana. Mastercard piloting merchant settlements. Payment giants validating Solana as enterprise-grade rails.",
-                "url": "https://www.dlnews.com/articles/markets/why-solana-stablecoin-action-boomed/",
-                "category": "stablecoins_payfi",
-                "evidence": ["Visa settlement live", "Mastercard pilot", "Enterprise validation"],
-                "why_emerging": "Card networks see blockchain as cost reduction. Solana's proven uptime and speed meet enterprise SLAs. First-mover advantage in B2B payments."
-            },
-            # RWA Tokenization - WHY IT'S EMERGING
-            {
-                "source": "research",
-                "title": "Ondo Finance: 200+ Tokenized Assets on Solana",
-                "description": "Ondo launches 200+ tokenized stocks, ETFs, bonds on Solana. Largest RWA issuer by asset count. Controls 65% of individual tokenized RWA market.",
-                "url": "https://www.coindesk.com/business/2026/01/21/ondo-finance-brings-200-tokenized-u-s-stocks-and-etfs-to-solana",
-                "category": "rwa_tokenization",
-                "evidence": ["200+ assets", "65% market share", "Stocks + ETFs + Bonds"],
-                "why_emerging": "SEC clarity on tokenized securities. TradFi demand for 24/7 markets. Solana's compliance-ready infrastructure (AML, KYC hooks)."
-            },
-            {
-                "source": "research",
-                "title": "Tokenized Equities Market Explodes 2800% to $963M",
-                "description": "Tokenized equities market reaches $963M in January 2026, up 2800% YoY. Regulatory tailwinds and institutional demand driving explosive growth.",
-                "url": "https://www.coindesk.com/business/2026/01/30/tokenized-equities-exploded-3000-percent",
-                "category": "rwa_tokenization",
-                "evidence": ["$963M market", "2800% YoY growth", "Institutional demand"],
-                "why_emerging": "BlackRock and Fidelity entering space. 24/7 trading demand from global investors. T+0 settlement superior to T+2 traditional."
-            },
-            {
-                "source": "research",
-                "title": "WisdomTree Tokenized Funds on Solana",
-                "description": "WisdomTree brings full suite of tokenized funds to Solana as RWA surpasses $1B. ETF giant validates blockchain for asset management.",
-                "url": "https://www.businesswire.com/news/home/20260128885072/en/WisdomTree-Expands-Tokenization-to-Solana",
-                "category": "rwa_tokenization",
-                "evidence": ["WisdomTree", "$1B+ RWA", "ETF-grade products"],
-                "why_emerging": "Traditional asset managers can't ignore on-chain efficiency. Solana winning institutional deals over Ethereum for cost/speed."
-            },
-            # Mobile/Consumer - WHY IT'S EMERGING
-            {
-                "source": "research",
-                "title": "Solana Seeker: 150K+ Preorders, SKR Token Launch",
-                "description": "Solana Mobile's Seeker phone launches with 150K+ preorders. 1.8B SKR token airdrop creates new hardware-gated distribution model.",
-                "url": "https://www.theblock.co/post/386449/solana-mobile-seeker-skr-token-airdrop",
-                "category": "mobile_consumer",
-                "evidence": ["150K preorders", "1.8B token airdrop", "Hardware-gated airdrops"],
-                "why_emerging": "Saga success proved demand. Hardware wallets solve UX. Token airdrops subsidize consumer adoption. Web3 phone becomes trojan horse."
-            },
-            {
-                "source": "research",
-                "title": "Mobile DeFi Usage Surges on Solana",
-                "description": "40% of Solana DEX trades now originate from mobile. Phantom and Jupiter mobile apps seeing record usage. Consumer UX finally reaching parity.",
-                "url": "https://cryptomaniaks.com/news/solana-seeker-review-skr-token-staking-apy",
-                "category": "mobile_consumer",
-                "evidence": ["40% mobile DEX trades", "Record app usage", "UX parity achieved"],
-                "why_emerging": "Mobile-first generation entering crypto. Wallet UX dramatically improved. Native dApp stores bypass Apple/Google restrictions."
-            },
-            # DePIN - WHY IT'S EMERGING
-            {
-                "source": "research",
-                "title": "Dawn Network: DePIN Internet Sharing Explodes",
-                "description": "Dawn Network allows bandwidth sharing via rooftop hardware. 50K+ nodes active. DePIN model proving real-world infrastructure can decentralize.",
-                "url": "https://www.hokanews.com/2026/01/dawn-network-airdrop-stays-hot.html",
-                "category": "depin",
-                "evidence": ["50K+ nodes", "Bandwidth sharing", "Real-world infrastructure"],
-                "why_emerging": "Hardware costs dropped. Token incentives align contributors. Solana's speed enables real-time IoT coordination. Helium proved model works."
-            },
-            {
-                "source": "research",
-                "title": "DePIN TVL Crosses $5B on Solana",
-                "description": "Combined DePIN total value (Render, Helium, io.net, Nosana, Hivemapper) crosses $5B. GPU compute and wireless leading categories.",
-                "url": "https://investinghaven.com/solana-sol-price-predictions/",
-                "category": "depin",
-                "evidence": ["$5B+ DePIN TVL", "GPU + Wireless focus", "5 major protocols"],
-                "why_emerging": "AI training demand outstripping centralized supply. Decentralized compute 60% cheaper. Geographic distribution = resilience."
-            },
-            # Memecoins - WHY IT'S EMERGING (still!)
-            {
-                "source": "research",
-                "title": "Pump.fun: 300K Daily Users, 39K Tokens/Day",
-                "description": "Pump.fun dominates Solana meme ecosystem. 300K daily active addresses. 39K token creations in single day. PUMP token up 34%.",
-                "url": "https://www.bitget.com/news/detail/12560605178213",
-                "category": "memecoins",
-                "evidence": ["300K DAU", "39K tokens/day", "PUMP +34%"],
-                "why_emerging": "Bonding curve innovation removed rug risk. Low friction = high velocity. Cultural moment for meme trading. Solana speed = better trading UX."
-            },
-            {
-                "source": "research",
-                "title": "Meme Launchpad Volume Hits $180M Single Day",
-                "description": "Solana token launchpad volume reached $180M on Jan 26, 2026. Meme season showing no signs of slowing despite market volatility.",
-                "url": "https://finance.yahoo.com/news/solana-news-sol-slides-shutdown-155002508.html",
-                "category": "memecoins",
-                "evidence": ["$180M daily volume", "Sustained momentum", "Volatility-resistant"],
-                "why_emerging": "Cultural narrative stronger than fundamentals. Low barrier to participation. Community-driven price discovery. Entertainment value."
-            },
-            # DeFi Evolution
-            {
-                "source": "research",
-                "title": "Jupiter: #1 DEX Aggregator Processes $100B+ Volume",
-                "description": "Jupiter processed over $100B cumulative volume. Perp DEX launched. JUP staking and governance creating DeFi flywheel.",
-                "url": "https://www.jupiter.ag",
-                "category": "defi_evolution",
-                "evidence": ["$100B+ volume", "Perp launch", "JUP staking"],
-                "why_emerging": "Aggregation layer becoming essential. Perp demand from CEX refugees. DAO governance engaging community."
-            },
-            {
-                "source": "research",
-                "title": "Liquid Staking Wars: jitoSOL vs mSOL vs bSOL",
-                "description": "Liquid staking competition intensifies. Jito pioneered MEV rewards. Marinade largest by TVL. New entrants differentiating on yield and governance.",
-                "url": "https://defillama.com/chain/Solana",
-                "category": "defi_evolution",
-                "evidence": ["$3B+ LST TVL", "MEV rewards", "Yield competition"],
-                "why_emerging": "Ethereum showed LST potential. MEV extraction profitable. Staking = passive income for holders."
-            },
-        ]
+        return _RESEARCH_DATA
     
     def get_signals(self) -> List[Signal]:
         """Convert research data to Signal objects"""
         signals = []
+        now = datetime.now()  # one load timestamp for the whole batch
         for data in self.research_data:
             metadata = {
                 "category": data.get("category", ""),
@@ -413,45 +583,53 @@ class ResearchSignalGenerator:
                 title=data["title"],
                 description=data["description"],
                 url=data.get("url", ""),
-                timestamp=datetime.now(),
+                timestamp=now,
                 metadata=metadata
             )
             signals.append(signal)
         return signals
 
 
-def fetch_all_signals() -> List[Signal]:
+def fetch_all_signals(use_cache: bool = True) -> List[Signal]:
     """Fetch signals from all available sources"""
     all_signals = []
     
-    # Helius on-chain signals (HIGHEST PRIORITY - real data!)
-    print("Fetching Helius on-chain signals...")
-    try:
-        helius = HeliusSignalAdapter()
-        helius_signals = helius.get_signals()
-        all_signals.extend(helius_signals)
-        print(f"    ✓ Found {len(helius_signals)} on-chain signals")
-    except Exception as e:
-        print(f"    ⚠️ Helius fetch failed: {e}")
-    
-    # GitHub signals (with auth for better rate limits)
-    print("Fetching GitHub signals...")
-    github = GitHubFetcher()
-    github_signals = github.fetch_trending_repos(days=14, limit=40)
+    # Both fetches are network-bound and independent, so the GitHub searches
+    # run in the background while Helius is queried; the signals are still
+    # collected in source order below
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # GitHub signals (with auth for better rate limits)
+        log.info("Fetching GitHub signals...")
+        github = GitHubFetcher(use_cache=use_cache)
+        github_future = executor.submit(github.fetch_trending_repos, days=14, limit=40)
+        
+        # Helius on-chain signals (HIGHEST PRIORITY - real data!)
+        log.info("Fetching Helius on-chain signals...")
+        try:
+            helius = HeliusSignalAdapter(use_cache=use_cache)
+            helius_signals = helius.get_signals()
+            all_signals.extend(helius_signals)
+            log.info("Found %d on-chain signals", len(helius_signals))
+        except Exception as e:
+            log.warning("Helius fetch failed: %s", e)
+        
+        github_signals = github_future.result()
     all_signals.extend(github_signals)
-    print(f"    ✓ Found {len(github_signals)} GitHub signals")
+    log.info("Found %d GitHub signals", len(github_signals))
     
     # Research-based signals (curated insights)
-    print("Loading research signals...")
+    log.info("Loading research signals...")
     research = ResearchSignalGenerator()
     research_signals = research.get_signals()
     all_signals.extend(research_signals)
-    print(f"    ✓ Found {len(research_signals)} research signals")
+    log.info("Found %d research signals", len(research_signals))
     
     return all_signals
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="    %(message)s")
+    
     signals = fetch_all_signals()
     print(f"\nTotal signals collected: {len(signals)}")
     for s in signals[:5]: